@@ -1,9 +1,105 @@
+import atexit
 import logging
 import os
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import List, Optional
+
+_LOG_BUFFER_BYTES = 64 * 1024
+_LOG_FLUSH_INTERVAL_SECONDS = 0.5
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that coalesces records into fewer write() syscalls.
+
+    StreamHandler flushes the file after every record. Here the stream keeps
+    a 64 KiB buffer that is flushed on WARNING and above, at most every
+    `flush_interval` seconds otherwise (a daemon thread covers quiet periods),
+    and when logging shuts down at interpreter exit. The file and the flush
+    thread are only created once the first record is written.
+    """
+
+    def __init__(
+        self, filename: Path, flush_interval: float = _LOG_FLUSH_INTERVAL_SECONDS
+    ) -> None:
+        self._flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        self._stop_flusher = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        super().__init__(filename, delay=True)
+
+    def _open(self):
+        if self._flusher is None:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically, name="log-flush", daemon=True
+            )
+            self._flusher.start()
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=_LOG_BUFFER_BYTES,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if record.levelno >= logging.WARNING:
+            self._flush_now()
+
+    def flush(self) -> None:
+        # Called by StreamHandler.emit after every record; let it through
+        # only once per interval.
+        if time.monotonic() - self._last_flush >= self._flush_interval:
+            self._flush_now()
+
+    def close(self) -> None:
+        self._stop_flusher.set()
+        super().close()
+
+    def _flush_now(self) -> None:
+        self._last_flush = time.monotonic()
+        super().flush()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_flusher.wait(self._flush_interval):
+            self._flush_now()
+
+
+class _LazyQueueHandler(QueueHandler):
+    """QueueHandler that starts its listener thread on the first record."""
+
+    def __init__(
+        self,
+        log_queue: "queue.SimpleQueue[logging.LogRecord]",
+        listener: QueueListener,
+    ) -> None:
+        super().__init__(log_queue)
+        self.listener = listener
+        self._listener_started = False
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # Runs under the handler lock, so the listener is started only once.
+        if not self._listener_started:
+            self._listener_started = True
+            self.listener.start()
+            # Registered after logging's own shutdown hook, so it runs first
+            # and the queue is drained before the handlers are closed.
+            atexit.register(self.listener.stop)
+        super().enqueue(record)
+
+
+# Owns the real handlers once logging is configured; see _configure_logging.
+_log_listener: Optional[QueueListener] = None
 
 
 def _configure_logging() -> None:
+    global _log_listener
+
     log_level_env = os.environ.get("LOG_LEVEL", "INFO")
     try:
         numeric_level = int(str(log_level_env).strip())
@@ -15,28 +111,44 @@ def _configure_logging() -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
 
+    if _log_listener is not None:
+        return
+
+    handlers: List[logging.Handler] = []
+
     if not root_logger.handlers:
         stream_handler = logging.StreamHandler()
         stream_handler.setLevel(numeric_level)
         stream_handler.setFormatter(
             logging.Formatter("%(asctime)s %(name)s %(levelname)s: %(message)s")
         )
-        root_logger.addHandler(stream_handler)
+        handlers.append(stream_handler)
 
     log_file_path = Path(__file__).resolve().parent / "log.txt"
-    log_file_path.parent.mkdir(parents=True, exist_ok=True)
 
     if not any(
         isinstance(handler, logging.FileHandler)
         and getattr(handler, "baseFilename", None) == str(log_file_path)
         for handler in root_logger.handlers
     ):
-        file_handler = logging.FileHandler(log_file_path)
+        file_handler = _BufferedFileHandler(log_file_path)
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(
             logging.Formatter("%(asctime)s %(name)s %(levelname)s: %(message)s")
         )
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if not handlers:
+        return
+
+    # Console and file writes happen on the listener thread, so logging from
+    # coroutines only enqueues the record instead of blocking the event loop.
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    queue_handler = _LazyQueueHandler(log_queue, _log_listener)
+    # Drop filtered-out records before QueueHandler formats them on the caller
+    queue_handler.setLevel(numeric_level)
+    root_logger.addHandler(queue_handler)
 
 
 _configure_logging()
@@ -22,9 +22,9 @@ from hexbytes import HexBytes
 from web3 import Web3
 from web3.contract import Contract
 from web3.exceptions import ContractLogicError
-from web3.middleware import ExtraDataToPOAMiddleware
 from web3.types import TxParams
 
+from .eth_client import checksum_address, get_web3
 from .gas_limits import MAX_TRANSACTION_GAS
 from .nonce_utils import get_shared_nonce_lock
 
@@ -274,7 +274,7 @@ class ActionRecorder:
             return
 
         try:
-            w3 = Web3(Web3.HTTPProvider(rpc_url))
+            w3 = get_web3(rpc_url)
         except Exception as exc:
             self._logger.error(f"Failed to create Web3 provider: {exc}")
             return
@@ -285,9 +285,6 @@ class ActionRecorder:
             )
             return
 
-        # Inject POA middleware for chains such as Gnosis/Base.
-        self._inject_poa_middleware(w3)
-
         try:
             account = w3.eth.account.from_key(private_key)
         except ValueError as exc:
@@ -295,8 +292,8 @@ class ActionRecorder:
             return
 
         try:
-            checksum_address = Web3.to_checksum_address(self._config.contract_address)
-            contract = w3.eth.contract(address=checksum_address, abi=ACTION_REPO_ABI)
+            contract_address = checksum_address(self._config.contract_address)
+            contract = w3.eth.contract(address=contract_address, abi=ACTION_REPO_ABI)
         except Exception as exc:
             self._logger.error(f"Failed to instantiate action repo contract: {exc}")
             return
@@ -371,13 +368,13 @@ class ActionRecorder:
 
         if safe_addr:
             try:
-                safe_checksum = Web3.to_checksum_address(safe_addr)
+                safe_checksum = checksum_address(safe_addr)
                 safe_contract = w3.eth.contract(address=safe_checksum, abi=SAFE_ABI)
                 # Extra diagnostics: confirm resolved Safe and chain id
                 try:
                     chain_id = w3.eth.chain_id  # type: ignore[attr-defined]
                     account_addr = account.address
-                    account_checksum = Web3.to_checksum_address(account_addr)
+                    account_checksum = checksum_address(account_addr)
                     self._logger.info(
                         "Using Safe %s on chainId %s with Agent EOA %s",
                         safe_checksum,
@@ -672,7 +669,7 @@ class ActionRecorder:
                         return False
 
                     try:
-                        expected_main_signer = Web3.to_checksum_address(
+                        expected_main_signer = checksum_address(
                             contract.functions.mainSigner().call()
                         )
                     except Exception as exc:
@@ -681,7 +678,7 @@ class ActionRecorder:
                         )
                         return False
 
-                    recovered_inner_cs = Web3.to_checksum_address(recovered_inner)
+                    recovered_inner_cs = checksum_address(recovered_inner)
                     matches_main_signer = recovered_inner_cs == expected_main_signer
                     self._logger.info(
                         f"Inner recordAction signer: {recovered_inner_cs}; "
@@ -936,11 +933,9 @@ class ActionRecorder:
                                 )
                             except Exception:
                                 threshold_dbg = None
-                            owner_set = {
-                                Web3.to_checksum_address(o) for o in owners_dbg
-                            }
+                            owner_set = {checksum_address(o) for o in owners_dbg}
                             is_owner_recovered = (
-                                Web3.to_checksum_address(recovered) in owner_set
+                                checksum_address(recovered) in owner_set
                             )
                             self._logger.info(
                                 f"Recovered signer: {recovered}; is_owner={is_owner_recovered}; "
@@ -948,8 +943,8 @@ class ActionRecorder:
                             )
                             # Abort early if signer doesn't match the agent EOA or is not a Safe owner
                             try:
-                                recovered_cs = Web3.to_checksum_address(recovered)
-                                account_cs = Web3.to_checksum_address(account.address)
+                                recovered_cs = checksum_address(recovered)
+                                account_cs = checksum_address(account.address)
                             except Exception:
                                 recovered_cs = recovered
                                 account_cs = account.address
@@ -1309,7 +1304,7 @@ class ActionRecorder:
 
         now = time.time()
         try:
-            account_checksum = Web3.to_checksum_address(acct.address)
+            account_checksum = checksum_address(acct.address)
         except Exception:
             account_checksum = acct.address
 
@@ -1337,7 +1332,7 @@ class ActionRecorder:
 
         safe_address_str = "unknown"
         try:
-            safe_address_str = Web3.to_checksum_address(safe.address)  # type: ignore[attr-defined]
+            safe_address_str = checksum_address(safe.address)  # type: ignore[attr-defined]
         except Exception:
             pass
 
@@ -1368,7 +1363,7 @@ class ActionRecorder:
         normalized_owner_set: Set[str] = set()
         for owner in owners_raw:
             try:
-                normalized_owner_set.add(Web3.to_checksum_address(owner))
+                normalized_owner_set.add(checksum_address(owner))
             except Exception:
                 continue
 
@@ -1382,7 +1377,7 @@ class ActionRecorder:
         if log_snapshot:
             safe_addr_display = "unknown"
             try:
-                safe_addr_display = Web3.to_checksum_address(safe.address)  # type: ignore[attr-defined]
+                safe_addr_display = checksum_address(safe.address)  # type: ignore[attr-defined]
             except Exception:
                 pass
             self._logger.info(
@@ -1452,7 +1447,7 @@ class ActionRecorder:
         if not is_owner:
             safe_address_str = "unknown"
             try:
-                safe_address_str = Web3.to_checksum_address(safe.address)  # type: ignore[attr-defined]
+                safe_address_str = checksum_address(safe.address)  # type: ignore[attr-defined]
             except Exception:
                 pass
             self._logger.error(
@@ -1516,7 +1511,7 @@ class ActionRecorder:
             return None
 
         try:
-            verifying_contract = Web3.to_checksum_address(self._contract.address)
+            verifying_contract = checksum_address(self._contract.address)
         except Exception as exc:
             self._logger.error(
                 f"Failed to normalise verifying contract for recordAction hash: {exc}"
@@ -1597,7 +1592,7 @@ class ActionRecorder:
             safe_address = None
         if safe_address:
             try:
-                cache_key = Web3.to_checksum_address(safe_address)
+                cache_key = checksum_address(safe_address)
             except Exception:
                 cache_key = safe_address.lower()
 
@@ -1987,17 +1982,6 @@ class ActionRecorder:
             pass
         return None
 
-    def _inject_poa_middleware(self, w3: Web3) -> None:
-        """Inject a POA-compatible middleware when available."""
-        try:
-            w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
-        except ValueError:
-            pass
-        except Exception as exc:
-            self._logger.debug(
-                f"Failed to inject extra-data POA middleware fallback: {exc}"
-            )
-
     def _to_bytes(self, data: Any) -> bytes:
         """Normalize hex string or HexBytes to raw bytes."""
         if isinstance(data, (bytes, bytearray)):
@@ -0,0 +1,95 @@
+"""Process-wide Web3 clients shared by the Pett agent components."""
+
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from web3 import Web3
+from web3.exceptions import ExtraDataLengthError
+from web3.middleware import ExtraDataToPOAMiddleware
+
+logger = logging.getLogger(__name__)
+
+
+def _build_http_session() -> requests.Session:
+    """Return a keep-alive session with a pooled, retrying HTTP adapter."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=2,
+            # Only retry what the node never processed: failed connects and 429
+            # rate limiting. A 502/504 or read timeout can follow a raw tx the
+            # node already accepted, so replaying it is left to the caller.
+            read=0,
+            backoff_factor=0.2,
+            status_forcelist=(429,),
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared by every provider so RPC calls reuse warm connections.
+_HTTP_SESSION = _build_http_session()
+
+
+@lru_cache(maxsize=4)
+def get_web3(rpc_url: str) -> Web3:
+    """Return the shared Web3 client for an RPC endpoint.
+
+    Components signing with the same EOA (checkpoint, action recording) talk
+    to the same endpoint, so they share one provider, one connection pool and
+    a single POA probe instead of building their own.
+    """
+    # eth_chainId never changes for an endpoint; let the provider answer the
+    # per-call chain id validation from its request cache.
+    w3 = Web3(
+        Web3.HTTPProvider(
+            rpc_url,
+            session=_HTTP_SESSION,
+            cache_allowed_requests=True,
+            cacheable_requests={"eth_chainId"},
+        )
+    )
+    _inject_poa_middleware(w3, rpc_url)
+    return w3
+
+
+@lru_cache(maxsize=256)
+def checksum_address(address: str) -> str:
+    """Return the EIP-55 checksum form of an address, memoised per input.
+
+    The agent checksums the same handful of addresses (agent EOA, safe,
+    contracts) on every submission; caching skips the repeated keccak.
+    """
+    return Web3.to_checksum_address(address)
+
+
+def _inject_poa_middleware(w3: Web3, rpc_url: str) -> None:
+    """Inject POA middleware when the endpoint requires it (e.g. Gnosis)."""
+    # Without the middleware, web3 rejects POA headers whose extraData exceeds
+    # 32 bytes; probe once so non-POA chains skip the extra formatting.
+    try:
+        w3.eth.get_block("latest", full_transactions=False)
+        return
+    except ExtraDataLengthError:
+        pass
+    except Exception as exc:
+        # Undecided: inject defensively, it is harmless on non-POA chains.
+        logger.debug("POA probe failed for %s: %s", rpc_url, exc)
+
+    try:
+        w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+    except ValueError:
+        pass
+    except Exception as exc:
+        logger.debug(f"Failed to inject POA middleware fallback: {exc}")
@@ -3,8 +3,7 @@ from __future__ import annotations
 import threading
 from typing import Dict
 
-from web3 import Web3
-
+from .eth_client import checksum_address
 
 _address_locks: Dict[str, threading.Lock] = {}
 _global_lock = threading.Lock()
@@ -17,7 +16,7 @@ def get_shared_nonce_lock(address: str) -> threading.Lock:
     that sign and send with the same EOA to avoid nonce races.
     """
     try:
-        addr = str(Web3.to_checksum_address(address))
+        addr = str(checksum_address(address))
     except Exception:
         addr = (address or "").strip()
 
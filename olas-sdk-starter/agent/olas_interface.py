@@ -16,7 +16,6 @@ from collections import deque
 import aiohttp
 from eth_account import Account
 from web3 import Web3
-from web3.middleware import ExtraDataToPOAMiddleware
 
 if TYPE_CHECKING:
     from .pett_agent import PettAgent
@@ -33,6 +32,7 @@ from .staking_checkpoint import (
     DEFAULT_STATE_FILE,
 )
 from .agent_performance import AgentPerformanceStore
+from .eth_client import checksum_address, get_web3
 import subprocess
 import mimetypes
 
@@ -237,7 +237,7 @@ class OlasInterface:
             return None
         try:
             account = Account.from_key(private_key)
-            return Web3.to_checksum_address(account.address)
+            return checksum_address(account.address)
         except Exception as exc:
             self.logger.debug("Failed to derive agent address: %s", exc)
             return None
@@ -256,7 +256,7 @@ class OlasInterface:
             if not value or not value.strip():
                 continue
             try:
-                return Web3.to_checksum_address(value.strip())
+                return checksum_address(value.strip())
             except Exception as exc:
                 self.logger.warning(
                     "Invalid safe address in %s ignored: %s", env_name, exc
@@ -295,18 +295,18 @@ class OlasInterface:
             value = mapping.get(key)
             if value:
                 try:
-                    return Web3.to_checksum_address(str(value).strip())
+                    return checksum_address(str(value).strip())
                 except Exception:
                     continue
         if len(mapping) == 1:
             value = next(iter(mapping.values()))
             try:
-                return Web3.to_checksum_address(str(value).strip())
+                return checksum_address(str(value).strip())
             except Exception:
                 return None
         for value in mapping.values():
             try:
-                return Web3.to_checksum_address(str(value).strip())
+                return checksum_address(str(value).strip())
             except Exception:
                 continue
         return None
@@ -387,13 +387,9 @@ class OlasInterface:
         if not rpc_url:
             raise RuntimeError(f"No RPC URL configured for chain '{chain}'")
         try:
-            w3 = Web3(Web3.HTTPProvider(rpc_url))
+            w3 = get_web3(rpc_url)
             if not w3.is_connected():
                 raise RuntimeError("RPC connection failed")
-            try:
-                w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
-            except ValueError:
-                pass
         except Exception as exc:
             raise RuntimeError(f"Failed to initialise Web3 for {chain}: {exc}") from exc
         self._funds_web3_clients[chain_key] = w3
@@ -442,7 +438,7 @@ class OlasInterface:
         if value is None:
             return None
         try:
-            return Web3.to_checksum_address(str(value).strip())
+            return checksum_address(str(value).strip())
         except Exception:
             self.logger.debug("Invalid address in funds requirements: %s", value)
             return None
@@ -1096,6 +1092,9 @@ class OlasInterface:
                 state_file=state_file_path,
                 staking_token_address=staking_token_address,
             )
+            if self.staking_checkpoint_client is not None:
+                # Release the previous client's worker threads before replacing it
+                self.staking_checkpoint_client.close()
             self.staking_checkpoint_client = StakingCheckpointClient(
                 config=config, logger=self.logger
             )
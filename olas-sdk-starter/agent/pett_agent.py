@@ -3441,9 +3441,9 @@ class PettAgent:
             # Update health status
             self.olas.update_health_status("shutting_down", is_transitioning=True)
 
-            # Disconnect WebSocket
+            # Disconnect WebSocket and stop its listener
             if self.websocket_client:
-                await self.websocket_client.disconnect()
+                await self.websocket_client.close()
                 self.logger.info("🔌 WebSocket disconnected")
 
             # Stop web server
@@ -3463,6 +3463,16 @@ class PettAgent:
                 self.logger.debug(
                     "Failed to persist agent performance metrics on shutdown: %s", exc
                 )
+            try:
+                checkpoint_client = (
+                    self.olas.get_staking_checkpoint_client() if self.olas else None
+                )
+                if checkpoint_client:
+                    checkpoint_client.close()
+            except Exception as exc:
+                self.logger.debug(
+                    "Failed to close staking checkpoint client on shutdown: %s", exc
+                )
 
     def get_action_timing_info(self) -> Dict[str, Any]:
         """Expose action scheduling info for UI/health."""
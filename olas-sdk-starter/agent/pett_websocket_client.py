@@ -1,12 +1,16 @@
 import asyncio
+import base64
 import json
 import logging
 import os
 import platform
-import random
+import re
 import ssl
+import sys
+import time
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
 
 import certifi
 import websockets
@@ -14,6 +18,29 @@ from dotenv import load_dotenv
 
 from .action_recorder import ActionRecorder
 
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    # Fallback to the stdlib codec when orjson is not installed, emitting the
+    # same compact, non-ASCII-escaped UTF-8 frames
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode(
+            "utf-8"
+        )
+
+    _json_loads = json.loads
+
+
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as _async_timeout
+else:
+    # aiohttp already pulls in async-timeout on these versions
+    from async_timeout import timeout as _async_timeout
+
 try:
     from .constants import REQUIRED_ACTIONS_PER_EPOCH
 except ImportError:
@@ -27,12 +54,99 @@ logger = logging.getLogger(__name__)
 
 AGENT_CERTS_DIR = Path(__file__).resolve().parent / "certs"
 DEFAULT_WS_CA_FILE = AGENT_CERTS_DIR / "ws_pett_ai_ca.pem"
+# Treat a Privy JWT as expired slightly before its `exp` claim
+JWT_EXPIRY_LEEWAY_SECONDS = 5
+# Outbound frame queue bounds for the single sender task
+OUTBOX_MAX_SIZE = 512
+OUTBOX_BATCH_SIZE = 32
+# Verified actions waiting for the single on-chain record worker
+RECORD_QUEUE_MAX_SIZE = 256
+# Slots in the pending-response ring (power of two; indexed by nonce & mask)
+PENDING_RING_SIZE = 1024
+_PENDING_RING_MASK = PENDING_RING_SIZE - 1
+# Error-text classifiers ("exp" also covers jwt_expired/token expired/expired jwt)
+_JWT_EXPIRED_RE = re.compile(r"exp|jwt|timestamp check failed", re.IGNORECASE)
+_KEEPALIVE_ERROR_RE = re.compile(r"1011|keepalive|ping timeout", re.IGNORECASE)
+_CONNECTION_ERROR_RE = re.compile(
+    r"1011|keepalive|ping timeout|connection", re.IGNORECASE
+)
+# Cheap pre-parse peek at "type" values in a raw frame
+_FRAME_TYPE_RE = re.compile(rb'"type"\s*:\s*"([^"\\]+)"')
+# Shared read-only stand-in for missing sub-objects in incoming messages
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+# Shared "data" payload for parameterless requests. A plain dict so both JSON
+# codecs and the telemetry recorder treat it like any payload; never mutate it
+_EMPTY_DATA: Dict[str, Any] = {}
+# Data requests answered by a "data" frame: request msg_type -> result label
+_DATA_REQUEST_LABELS: Mapping[str, str] = MappingProxyType(
+    {"KITCHEN_GET": "kitchen", "MALL_GET": "mall", "CLOSET_GET": "closet"}
+)
+# Sentinel for an empty balance cache (raw balances may legitimately be None)
+_NO_BALANCE = object()
+# Stat keys reported by get_pet_status_summary, in display order
+_PET_STAT_KEYS = ("hunger", "health", "energy", "happiness", "hygiene")
+# Parameterless pet actions: msg_type -> (timeout, record when already clean, log line)
+_SIMPLE_ACTIONS: Mapping[str, Tuple[int, bool, Optional[str]]] = MappingProxyType(
+    {
+        "RUB": (
+            10,
+            True,
+            "🧾 RUB: submitting verified on-chain record (success or already clean)",
+        ),
+        "SHOWER": (
+            10,
+            True,
+            "🧾 SHOWER: submitting verified on-chain record (success or already clean)",
+        ),
+        "THROWBALL": (
+            10,
+            False,
+            "✅ THROWBALL action confirmed; submitting verified on-chain record",
+        ),
+        "HOTEL_CHECK_IN": (10, False, None),
+        "HOTEL_CHECK_OUT": (10, False, None),
+    }
+)
+
+
+_JWT_REFRESH_INSTRUCTIONS = """
+🔑 JWT Token Refresh Instructions:
+
+1. **For Privy Authentication:**
+   - Go to your Privy dashboard or authentication flow
+   - Generate a new access token
+   - Update your PRIVY_TOKEN environment variable
+
+2. **For Session Authentication (Recommended):**
+   - Set PETT_SESSION_TOKEN to your session token (e.g. psess_...)
+   - Request a new session token from your backend if it was revoked or expired
+
+3. **Common Token Sources:**
+   - Privy Dashboard -> Access Tokens
+   - Your authentication provider's token endpoint
+   - Mobile app authentication flow
+
+4. **Environment Variable:**
+   - Update PRIVY_TOKEN in your .env file
+   - Restart the agent after updating the token
+
+5. **Token Format:**
+   - Ensure the token is valid and not expired
+   - Remove any "Bearer " prefix if present
+   - The token should be the raw JWT string
+"""
+
+
+WEI_PER_ETH = 10**18
+_DECIMAL_SCALES = tuple(10**d for d in range(19))
 
 
 def format_wei_to_eth(wei_value: str | int, decimals: int = 4) -> str:
     """
     Convert wei value to ETH with specified decimal places.
 
+    Uses exact integer arithmetic (rounding half up) instead of float division.
+
     Args:
         wei_value: The wei value as string or int
         decimals: Number of decimal places to show (default: 4)
@@ -41,20 +155,72 @@ def format_wei_to_eth(wei_value: str | int, decimals: int = 4) -> str:
         Formatted ETH value as string
     """
     try:
-        # Convert to int if it's a string
-        if isinstance(wei_value, str):
-            wei_value = int(wei_value)
-
-        # Convert wei to ETH (1 ETH = 10^18 wei)
-        eth_value = wei_value / (10**18)
-
-        # Format with specified decimal places
-        return f"{eth_value:.{decimals}f}"
-    except (ValueError, TypeError, ZeroDivisionError):
+        wei = int(wei_value)
+        scale = (
+            _DECIMAL_SCALES[decimals]
+            if 0 <= decimals < len(_DECIMAL_SCALES)
+            else 10**decimals
+        )
+        sign = "-" if wei < 0 else ""
+        scaled, remainder = divmod(abs(wei) * scale, WEI_PER_ETH)
+        if remainder * 2 >= WEI_PER_ETH:
+            scaled += 1
+        if decimals <= 0:
+            return f"{sign}{scaled}"
+        whole, frac = divmod(scaled, scale)
+        return f"{sign}{whole}.{frac:0{decimals}d}"
+    except (ValueError, TypeError):
         return "0.0000"
 
 
 class PettWebSocketClient:
+    # Fixed attribute layout: no per-instance __dict__, cheaper attribute access
+    __slots__ = (
+        "websocket_url",
+        "websocket",
+        "authenticated",
+        "pet_data",
+        "message_handlers",
+        "_builtin_dispatch",
+        "connection_established",
+        "privy_token",
+        "session_token",
+        "data_message",
+        "_inflight",
+        "_balance_cache",
+        "auth_future",
+        "_last_auth_error",
+        "_listener_task",
+        "_ws_ready",
+        "_outbox",
+        "_sender_task",
+        "_record_queue",
+        "_record_task",
+        "_jwt_expired",
+        "_privy_token_exp",
+        "_privy_bearer_token",
+        "_privy_bearer",
+        "_auth_frame_cache",
+        "_auth_ping_lock",
+        "_reconnect_lock",
+        "_reconnecting",
+        "_telemetry_recorder",
+        "_onchain_recording_enabled",
+        "_nonce_counter",
+        "_pending_ring",
+        "_action_recorder",
+        "_last_action_error",
+        "_saved_auth_token",
+        "_saved_auth_type",
+        "_was_previously_authenticated",
+        "_pending_auth_token",
+        "_pending_auth_type",
+        "_session_expires_at",
+        "_ssl_context",
+        "_epoch_change_checker",
+        "_onchain_success_recorder",
+    )
+
     def __init__(
         self,
         websocket_url: str | None = os.getenv(
@@ -73,20 +239,46 @@ class PettWebSocketClient:
         self.authenticated = False
         self.pet_data: Optional[Dict[str, Any]] = None
         self.message_handlers: Dict[str, List[Callable]] = {}
+        # Built-in handlers by incoming message type
+        self._builtin_dispatch: Dict[
+            str, Callable[[Dict[str, Any]], Awaitable[None]]
+        ] = {
+            "auth_result": self._handle_auth_result,
+            "pet_update": self._handle_pet_update,
+            "error": self._handle_error,
+            "data": self._handle_data,
+        }
         self.connection_established = False
         self.privy_token = (privy_token or os.getenv("PRIVY_TOKEN") or "").strip()
         self.session_token = (
             session_token or os.getenv("PETT_SESSION_TOKEN") or ""
         ).strip()
         self.data_message: Optional[Dict[str, Any]] = None
-        self.ai_search_future: Optional[asyncio.Future[str]] = None
-        self.kitchen_future: Optional[asyncio.Future[str]] = None
-        self.mall_future: Optional[asyncio.Future[str]] = None
-        self.closet_future: Optional[asyncio.Future[str]] = None
+        # Kitchen/mall/closet/AI search requests awaiting a "data" frame,
+        # keyed by request nonce: (request msg_type, future)
+        self._inflight: Dict[str, Tuple[str, asyncio.Future[str]]] = {}
+        # One-slot (raw balance object, formatted balance) cache
+        self._balance_cache: Tuple[Any, str] = (_NO_BALANCE, "")
         self.auth_future: Optional[asyncio.Future[bool]] = None
         self._last_auth_error: Optional[str] = None
+        # Single long-lived listener task; it follows the client across
+        # reconnects and waits on _ws_ready while no socket is open
         self._listener_task: Optional[asyncio.Task] = None
+        self._ws_ready: Optional[asyncio.Event] = None
+        # Outbound frames are written by a single sender task per connection
+        self._outbox: Optional[asyncio.Queue[Tuple[bytes, asyncio.Future]]] = None
+        self._sender_task: Optional[asyncio.Task] = None
+        # Verified actions are recorded on-chain one at a time by a worker task
+        self._record_queue: Optional[asyncio.Queue[Tuple[str, Dict[str, Any]]]] = None
+        self._record_task: Optional[asyncio.Task] = None
         self._jwt_expired: bool = False
+        # Cached `exp` claim of the current Privy JWT (None when unknown)
+        self._privy_token_exp: Optional[int] = self._decode_jwt_exp(self.privy_token)
+        # Cached "Bearer <token>" string for the most recently used Privy token
+        self._privy_bearer_token: str = ""
+        self._privy_bearer: str = ""
+        # (auth_type, token, data, encoded frame prefix) of the last AUTH sent
+        self._auth_frame_cache: Optional[Tuple[str, str, Dict[str, Any], bytes]] = None
         self._auth_ping_lock: asyncio.Lock = asyncio.Lock()
         # Lock to prevent concurrent reconnection attempts
         self._reconnect_lock: asyncio.Lock = asyncio.Lock()
@@ -98,8 +290,14 @@ class PettWebSocketClient:
         ] = None
         # Enable/disable on-chain recordAction scheduling globally
         self._onchain_recording_enabled: bool = True
-        # Pending nonce -> future mapping for correlating responses
-        self._pending_nonces: Dict[str, asyncio.Future[Dict[str, Any]]] = {}
+        # Monotonic counter backing _generate_nonce; random 32-bit start so
+        # separate client instances do not reuse each other's nonces
+        self._nonce_counter: int = int.from_bytes(os.urandom(4), "big")
+        # Pending (nonce, future) slots for correlating responses, indexed by
+        # the numeric nonce modulo PENDING_RING_SIZE
+        self._pending_ring: List[
+            Optional[Tuple[str, asyncio.Future[Dict[str, Any]]]]
+        ] = [None] * PENDING_RING_SIZE
         if not self.privy_token and not self.session_token:
             logger.warning(
                 "No auth token provided during initialization; authentication will be disabled until a token is set."
@@ -157,24 +355,67 @@ class PettWebSocketClient:
     def _schedule_verified_record_action(
         self, action_type: str, verification: Dict[str, Any]
     ) -> None:
-        """Schedule an asynchronous verified recordAction transaction if available."""
-        # Always check for epoch changes on every action
-        if self._epoch_change_checker:
+        """Queue a verified recordAction transaction for the record worker."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        if self._record_task is None or self._record_task.done():
+            self._record_queue = asyncio.Queue(maxsize=RECORD_QUEUE_MAX_SIZE)
+            self._record_task = asyncio.create_task(
+                self._record_worker(self._record_queue)
+            )
+        queue = self._record_queue
+        item = (action_type, verification)
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            # Keep the newest verification; the oldest is the most likely stale
+            dropped_type, _ = queue.get_nowait()
+            logger.warning(
+                "🧾 Record queue full; dropping oldest pending %s record",
+                dropped_type,
+            )
+            queue.put_nowait(item)
+
+    async def _record_worker(
+        self, queue: "asyncio.Queue[Tuple[str, Dict[str, Any]]]"
+    ) -> None:
+        """Record queued verified actions on-chain, one transaction at a time."""
+        while True:
+            action_type, verification = await queue.get()
             try:
-                loop = asyncio.get_running_loop()
-                # Schedule the epoch check and conditional recording
-                loop.create_task(
-                    self._check_epoch_and_maybe_record(action_type, verification)
+                if self._epoch_change_checker:
+                    # Always check for epoch changes on every action
+                    await self._check_epoch_and_maybe_record(action_type, verification)
+                else:
+                    await self._record_without_epoch_check(action_type, verification)
+            except Exception as exc:
+                logger.debug(
+                    "Verified action recorder task raised for %s: %s", action_type, exc
                 )
-                return
-            except RuntimeError:
+
+    async def _stop_record_worker(self) -> None:
+        """Cancel the record worker, discarding any actions still queued."""
+        task, self._record_task = self._record_task, None
+        self._record_queue = None
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
                 pass
 
-        # Fallback if no epoch checker is set
+    async def _record_without_epoch_check(
+        self, action_type: str, verification: Dict[str, Any]
+    ) -> None:
+        """Record an action when no epoch change checker is configured."""
         if not self._onchain_recording_enabled:
             logger.info(
-                f"Already have {REQUIRED_ACTIONS_PER_EPOCH}+ verified on-chain txs (staking threshold met); "
+                "Already have %s+ verified on-chain txs (staking threshold met); "
                 "skipping on-chain recording for %s",
+                REQUIRED_ACTIONS_PER_EPOCH,
                 action_type,
             )
             return
@@ -195,26 +436,10 @@ class PettWebSocketClient:
         if not normalized_type:
             return
 
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            return
-
-        task = loop.create_task(
-            self._action_recorder.record_action_verified(normalized_type, verification)
+        await self._action_recorder.record_action_verified(
+            normalized_type, verification
         )
 
-        def _handle_result(fut: asyncio.Future) -> None:
-            if fut.cancelled():
-                return
-            exc = fut.exception()
-            if exc:
-                logger.debug(
-                    "Verified action recorder task raised for %s: %s", action_type, exc
-                )
-
-        task.add_done_callback(_handle_result)
-
     async def _check_epoch_and_maybe_record(
         self, action_type: str, verification: Dict[str, Any]
     ) -> None:
@@ -241,8 +466,9 @@ class PettWebSocketClient:
         # Now decide whether to record based on current state
         if not self._onchain_recording_enabled:
             logger.info(
-                f"⏭️ Already have {REQUIRED_ACTIONS_PER_EPOCH}+ verified on-chain txs (staking threshold met); "
+                "⏭️ Already have %s+ verified on-chain txs (staking threshold met); "
                 "skipping on-chain recording for %s",
+                REQUIRED_ACTIONS_PER_EPOCH,
                 action_type,
             )
             return
@@ -297,26 +523,48 @@ class PettWebSocketClient:
             )
 
     def _generate_nonce(self) -> str:
-        """Generate a simple random numeric nonce as a string."""
-        return str(random.randint(10000, 99999))
+        """Generate a unique, monotonically increasing numeric nonce as a string."""
+        self._nonce_counter += 1
+        return str(self._nonce_counter)
 
     def _register_pending(self, nonce: str) -> asyncio.Future:
         """Create and register a pending future for the given nonce."""
-        fut: asyncio.Future = asyncio.Future()
-        self._pending_nonces[nonce] = fut  # type: ignore[assignment]
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending_ring[int(nonce) & _PENDING_RING_MASK] = (nonce, fut)
         return fut
 
+    def _pop_pending(self, nonce: Any) -> Optional[asyncio.Future]:
+        """Remove and return the future registered for ``nonce``, if still present."""
+        try:
+            idx = int(nonce) & _PENDING_RING_MASK
+        except (TypeError, ValueError):
+            return None
+        slot = self._pending_ring[idx]
+        # The slot may have been reused by a newer nonce; only match our own
+        if slot is None or slot[0] != str(nonce):
+            return None
+        self._pending_ring[idx] = None
+        return slot[1]
+
     def _resolve_pending(self, nonce: Optional[str], message: Dict[str, Any]) -> None:
         """Resolve any pending future by nonce with the provided message."""
         if not nonce:
             return
-        fut = self._pending_nonces.pop(nonce, None)
-        if fut and not fut.done():
-            try:
-                fut.set_result(message)
-            except Exception:
-                # Ignore resolution errors to avoid cascading failures
-                pass
+        fut = self._pop_pending(nonce)
+        if fut is not None:
+            self._settle(fut, message)
+
+    @staticmethod
+    def _settle(fut: asyncio.Future, value: Any) -> None:
+        """Set ``value`` on ``fut`` unless it is already done (timed out or cancelled).
+
+        Futures are only resolved from the listener task on the client's own
+        loop, so a direct set_result is safe and needs no done() pre-check.
+        """
+        try:
+            fut.set_result(value)
+        except asyncio.InvalidStateError:
+            pass
 
     async def connect(self) -> bool:
         """Establish WebSocket connection to Pett.ai server."""
@@ -325,11 +573,13 @@ class PettWebSocketClient:
                 logger.error("WebSocket URL is not set")
                 return False
 
-            logger.info(f"🔌 Connecting to WebSocket: {self.websocket_url}")
+            logger.info("🔌 Connecting to WebSocket: %s", self.websocket_url)
             connect_kwargs: Dict[str, Any] = {
                 "ping_interval": 20,
                 "ping_timeout": 10,
                 "close_timeout": 10,
+                # Small JSON frames; skip per-message deflate work on both ends
+                "compression": None,
             }
 
             ssl_context = self._ssl_context
@@ -360,16 +610,19 @@ class PettWebSocketClient:
                 **connect_kwargs,
             )
             self.connection_established = True
+            self._start_sender()
+            self._ensure_listener()
+            self._ws_ready.set()
             logger.info("✅ WebSocket connection established")
             return True
         except websockets.exceptions.InvalidURI as e:
-            logger.error(f"❌ Invalid WebSocket URL: {e}")
+            logger.error("❌ Invalid WebSocket URL: %s", e)
             return False
         except websockets.exceptions.ConnectionClosed as e:
-            logger.error(f"❌ WebSocket connection closed: {e}")
+            logger.error("❌ WebSocket connection closed: %s", e)
             return False
         except Exception as e:
-            logger.error(f"❌ Failed to connect to WebSocket: {e}")
+            logger.error("❌ Failed to connect to WebSocket: %s", e)
             return False
 
     def _build_ssl_context(self) -> Optional[ssl.SSLContext]:
@@ -390,7 +643,7 @@ class PettWebSocketClient:
                 # Linux/Windows: use certifi as base
                 context = ssl.create_default_context(cafile=certifi.where())
         except Exception as exc:
-            logger.error(f"❌ Failed to create default SSL context: {exc}")
+            logger.error("❌ Failed to create default SSL context: %s", exc)
             return None
 
         # Always add certifi bundle as additional source (works on all platforms)
@@ -398,7 +651,7 @@ class PettWebSocketClient:
             context.load_verify_locations(cafile=certifi.where())
         except Exception as exc:
             logger.debug(
-                f"Could not load certifi bundle (may already be included): {exc}"
+                "Could not load certifi bundle (may already be included): %s", exc
             )
 
         default_used = False
@@ -425,28 +678,113 @@ class PettWebSocketClient:
                         resolved_path,
                     )
             except Exception as exc:
-                logger.error(f"❌ Failed to load custom CA bundle: {exc}")
+                logger.error("❌ Failed to load custom CA bundle: %s", exc)
 
         return context
 
-    async def disconnect(self) -> None:
-        """Close WebSocket connection."""
-        if self._listener_task and not self._listener_task.done():
-            self._listener_task.cancel()
+    def _start_sender(self) -> None:
+        """Start the outbound sender task if it is not already running."""
+        if self._sender_task and not self._sender_task.done():
+            return
+        self._outbox = asyncio.Queue(maxsize=OUTBOX_MAX_SIZE)
+        self._sender_task = asyncio.create_task(self._sender_loop(self._outbox))
+
+    async def _stop_sender(self) -> None:
+        """Stop the sender task and fail any frames still waiting in the outbox."""
+        task, outbox = self._sender_task, self._outbox
+        self._sender_task = None
+        self._outbox = None
+        if task and not task.done():
+            task.cancel()
             try:
-                await self._listener_task
+                await task
             except asyncio.CancelledError:
                 pass
-        self._listener_task = None
-        if self.websocket:
-            await self.websocket.close()
-        self.websocket = None
+        while outbox is not None and not outbox.empty():
+            _, done = outbox.get_nowait()
+            if not done.done():
+                done.set_exception(
+                    websockets.exceptions.InvalidState("WebSocket connection closed")
+                )
+
+    async def _sender_loop(
+        self, outbox: "asyncio.Queue[Tuple[bytes, asyncio.Future]]"
+    ) -> None:
+        """Drain the outbox, writing queued frames back-to-back.
+
+        Each queued future is resolved with the outcome of its own send so
+        callers keep their per-message success/failure handling.
+        """
+        while True:
+            batch = [await outbox.get()]
+            while len(batch) < OUTBOX_BATCH_SIZE and not outbox.empty():
+                batch.append(outbox.get_nowait())
+            try:
+                for payload, done in batch:
+                    if done.done():
+                        # Caller gave up (cancelled) before the frame was written
+                        continue
+                    try:
+                        if self.websocket is None:
+                            raise websockets.exceptions.InvalidState(
+                                "WebSocket connection closed"
+                            )
+                        await self.websocket.send(payload, text=True)
+                    except Exception as exc:
+                        if not done.done():
+                            done.set_exception(exc)
+                    else:
+                        if not done.done():
+                            done.set_result(None)
+            finally:
+                # Cancelled mid-batch: never leave a caller waiting forever
+                for _, done in batch:
+                    if not done.done():
+                        done.set_exception(
+                            websockets.exceptions.InvalidState(
+                                "WebSocket connection closed"
+                            )
+                        )
+
+    async def _write_frame(self, payload: bytes) -> None:
+        """Send an encoded frame through the outbox (or directly if no sender)."""
+        outbox = self._outbox
+        if outbox is None or self._sender_task is None or self._sender_task.done():
+            await self.websocket.send(payload, text=True)
+            return
+        done = asyncio.get_running_loop().create_future()
+        await outbox.put((payload, done))
+        await done
+
+    async def disconnect(self) -> None:
+        """Close WebSocket connection.
+
+        The listener task is kept alive and resumes on the next connect();
+        use close() to stop it as well.
+        """
+        await self._stop_sender()
+        # Detach first so the listener treats the close as intentional
+        websocket, self.websocket = self.websocket, None
+        if websocket:
+            await websocket.close()
         self.connection_established = False
         self.authenticated = False
         # Note: We preserve _saved_auth_token and _was_previously_authenticated
         # for reconnection attempts
         logger.info("WebSocket connection closed")
 
+    async def close(self) -> None:
+        """Disconnect and stop the background listener and record tasks."""
+        await self.disconnect()
+        await self._stop_record_worker()
+        task, self._listener_task = self._listener_task, None
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
     def set_privy_token(self, privy_token: str) -> None:
         """Update the stored Privy token without reconnecting."""
         token = (privy_token or "").strip()
@@ -455,8 +793,11 @@ class PettWebSocketClient:
                 "⚠️ Attempted to set an empty Privy token - authentication will be disabled"
             )
             self.privy_token = ""
+            self._privy_token_exp = None
             return
         self.privy_token = token
+        self._privy_token_exp = self._decode_jwt_exp(token)
+        self._bearer_for(self._strip_bearer_prefix(token))
         self._jwt_expired = False
         self._last_auth_error = None
         # logger.info("Privy token updated on WebSocket client")
@@ -504,6 +845,13 @@ class PettWebSocketClient:
             return trimmed[7:].strip()
         return trimmed
 
+    def _bearer_for(self, token: str) -> str:
+        """Return "Bearer <token>", reusing the cached string for the same token."""
+        if token != self._privy_bearer_token:
+            self._privy_bearer_token = token
+            self._privy_bearer = "Bearer " + token
+        return self._privy_bearer
+
     def _infer_auth_type(self, token: str) -> Optional[str]:
         """Infer auth type from token format when possible."""
         trimmed = self._strip_bearer_prefix(token)
@@ -549,20 +897,33 @@ class PettWebSocketClient:
 
         return candidates
 
+    @staticmethod
+    def _decode_jwt_exp(token: str) -> Optional[int]:
+        """Return the unverified `exp` claim of a JWT, or None if unavailable."""
+        parts = (token or "").split(".")
+        if len(parts) != 3:
+            return None
+        payload = parts[1]
+        try:
+            claims = _json_loads(
+                base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+            )
+            exp = claims.get("exp")
+            return int(exp) if exp is not None else None
+        except (ValueError, TypeError, AttributeError):
+            return None
+
+    def _is_privy_token_expired(self, token: Optional[str] = None) -> bool:
+        """Check the cached JWT `exp` claim without contacting the server."""
+        if token is None or token == self.privy_token:
+            exp = self._privy_token_exp
+        else:
+            exp = self._decode_jwt_exp(token)
+        return exp is not None and time.time() >= exp - JWT_EXPIRY_LEEWAY_SECONDS
+
     def _is_jwt_expired_error(self, error_text: str) -> bool:
         """Check if the error string indicates a Privy JWT expiration."""
-        lowered = (error_text or "").lower()
-        return any(
-            keyword in lowered
-            for keyword in (
-                "exp",
-                "jwt_expired",
-                "timestamp check failed",
-                "jwt",
-                "token expired",
-                "expired jwt",
-            )
-        )
+        return bool(error_text) and _JWT_EXPIRED_RE.search(error_text) is not None
 
     def _is_session_token_invalid(self, error_text: str) -> bool:
         """Check if the error string indicates an invalid/expired session token."""
@@ -614,9 +975,33 @@ class PettWebSocketClient:
             logger.error("Invalid Privy auth token provided")
             return False
 
-        auth_hash = {"hash": "Bearer " + token}
+        if self._is_privy_token_expired(token):
+            # Known-expired JWT: skip the AUTH round-trip and its timeout
+            self._jwt_expired = True
+            self._last_auth_error = "JWT expired (exp claim is in the past)"
+            logger.warning("🔑 Privy JWT already expired; skipping authentication")
+            return False
+
+        auth_hash = {"hash": self._bearer_for(token)}
         return await self._authenticate("privy", auth_hash, token, timeout)
 
+    def _get_auth_frame(
+        self, auth_type: str, auth_hash: Dict[str, Any], token: str
+    ) -> Tuple[Dict[str, Any], bytes]:
+        """Return the AUTH data dict and its encoded frame up to the nonce value.
+
+        The result is cached per (auth_type, token) so reconnect/retry loops
+        reuse the same encoded bytes instead of re-serialising the payload.
+        """
+        cached = self._auth_frame_cache
+        if cached and cached[0] == auth_type and cached[1] == token:
+            return cached[2], cached[3]
+        data = {"params": {"authHash": auth_hash, "authType": auth_type}}
+        # Drop the closing brace so the nonce can be appended per send
+        prefix = _json_dumps({"type": "AUTH", "data": data})[:-1] + b',"nonce":"'
+        self._auth_frame_cache = (auth_type, token, data, prefix)
+        return data, prefix
+
     async def _authenticate(
         self,
         auth_type: str,
@@ -625,27 +1010,23 @@ class PettWebSocketClient:
         timeout: int = 10,
     ) -> bool:
         """Send an AUTH request with the provided auth payload and wait for response."""
+        # Create a future to wait for the auth result
+        auth_future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
         try:
-            # Create a future to wait for the auth result
-            auth_future: asyncio.Future[bool] = asyncio.Future()
-
             # Store the future so we can resolve it in the message handler
             self.auth_future = auth_future
             self._pending_auth_token = token
             self._pending_auth_type = auth_type
 
-            auth_message = {
-                "type": "AUTH",
-                "data": {
-                    "params": {
-                        "authHash": auth_hash,
-                        "authType": auth_type,
-                    }
-                },
-            }
+            # Splice a fresh nonce onto the pre-encoded static AUTH frame
+            auth_data, frame_prefix = self._get_auth_frame(auth_type, auth_hash, token)
+            nonce = self._generate_nonce()
+            auth_message = {"type": "AUTH", "data": auth_data, "nonce": nonce}
 
             # Send the auth message
-            success = await self._send_message(auth_message)
+            success = await self._send_message(
+                auth_message, encoded=frame_prefix + nonce.encode() + b'"}'
+            )
             if not success:
                 logger.error("Failed to send authentication message")
                 self._pending_auth_token = None
@@ -656,24 +1037,26 @@ class PettWebSocketClient:
 
             # Wait for the auth result with timeout
             try:
-                auth_result = await asyncio.wait_for(auth_future, timeout=timeout)
+                async with _async_timeout(timeout):
+                    auth_result = await auth_future
                 # logger.info(f"🔐 Authentication result: {auth_result}")
                 return auth_result
             except asyncio.TimeoutError:
                 # Timeout on single attempt is not critical - caller will handle retries
                 logger.debug(
-                    f"⏱️ Authentication response not received within {timeout}s"
+                    "⏱️ Authentication response not received within %ss", timeout
                 )
                 return False
 
         except Exception as e:
-            logger.error(f"❌ Error during authentication: {e}")
+            logger.error("❌ Error during authentication: %s", e)
             self._pending_auth_token = None
             self._pending_auth_type = None
             return False
         finally:
-            # Clean up the future
-            self.auth_future = None
+            # Clean up the future, unless a newer attempt has replaced it
+            if self.auth_future is auth_future:
+                self.auth_future = None
 
     async def register_privy(
         self,
@@ -708,15 +1091,13 @@ class PettWebSocketClient:
                 return False, None
 
         # Ensure we are listening for responses before sending the register command
-        if not self._listener_task or self._listener_task.done():
-            logger.debug("👂 Starting listener task prior to registration")
-            self._listener_task = asyncio.create_task(self.listen_for_messages())
+        self._ensure_listener()
 
         register_payload = {
             "params": {
                 "registerHash": {
                     "name": name,
-                    "hash": "Bearer " + token,
+                    "hash": self._bearer_for(token),
                 },
                 "authType": "privy",
             }
@@ -731,7 +1112,7 @@ class PettWebSocketClient:
             if isinstance(response, dict):
                 self._last_action_error = (
                     response.get("error")
-                    or response.get("data", {}).get("error")
+                    or (response.get("data") or _EMPTY).get("error")
                     or self._last_action_error
                 )
             return False, response
@@ -759,23 +1140,18 @@ class PettWebSocketClient:
 
         for attempt in range(max_retries):
             try:
-                logger.info(f"🔄 Connection attempt {attempt + 1}/{max_retries}")
+                logger.info("🔄 Connection attempt %s/%s", attempt + 1, max_retries)
 
                 # Try to connect
                 if not await self.connect():
-                    logger.warning(f"❌ Connection attempt {attempt + 1} failed")
+                    logger.warning("❌ Connection attempt %s failed", attempt + 1)
                     if attempt < max_retries - 1:
                         await asyncio.sleep(2**attempt)  # Exponential backoff
                         continue
                     return False
 
-                logger.info("✅ WebSocket connected, starting message listener...")
-
-                # Start listening for messages BEFORE authentication
-                if self._listener_task and not self._listener_task.done():
-                    self._listener_task.cancel()
-                self._listener_task = asyncio.create_task(self.listen_for_messages())
-                logger.info("👂 Started WebSocket message listener")
+                # connect() has (re)attached the shared listener before we authenticate
+                logger.info("✅ WebSocket connected, message listener attached")
 
                 logger.info("🔐 Attempting authentication...")
                 candidates = self._get_auth_candidates()
@@ -836,11 +1212,15 @@ class PettWebSocketClient:
                 # All candidates failed for this attempt
                 if attempt >= 3:
                     logger.warning(
-                        f"❌ Authentication attempt {attempt + 1}/{max_retries} failed"
+                        "❌ Authentication attempt %s/%s failed",
+                        attempt + 1,
+                        max_retries,
                     )
                 else:
                     logger.info(
-                        f"🔄 Authentication attempt {attempt + 1}/{max_retries} - retrying..."
+                        "🔄 Authentication attempt %s/%s - retrying...",
+                        attempt + 1,
+                        max_retries,
                     )
 
                 await self.disconnect()
@@ -851,7 +1231,7 @@ class PettWebSocketClient:
                 return False
 
             except Exception as e:
-                logger.error(f"❌ Error in connection attempt {attempt + 1}: {e}")
+                logger.error("❌ Error in connection attempt %s: %s", attempt + 1, e)
                 await self.disconnect()
                 if attempt < max_retries - 1:
                     await asyncio.sleep(2**attempt)  # Exponential backoff
@@ -971,9 +1351,7 @@ class PettWebSocketClient:
                     return False
 
             # Ensure listener is running to capture auth_result messages
-            if not self._listener_task or self._listener_task.done():
-                logger.debug("auth_ping: starting listener task for auth response")
-                self._listener_task = asyncio.create_task(self.listen_for_messages())
+            self._ensure_listener()
 
             try:
                 if auth_type == "session":
@@ -983,8 +1361,26 @@ class PettWebSocketClient:
                 logger.error("auth_ping error: %s", exc)
                 return False
 
-    async def _send_message(self, message: Dict[str, Any]) -> bool:
-        """Send a message to the WebSocket server."""
+    def _record_telemetry(
+        self, message: Dict[str, Any], success: bool, error: Optional[str]
+    ) -> None:
+        """Report an outgoing message outcome to the telemetry recorder, if set."""
+        recorder = self._telemetry_recorder
+        if recorder is None:
+            return
+        try:
+            recorder(message, success, error)
+        except Exception as exc:
+            logger.debug("Telemetry recorder failed: %s", exc)
+
+    async def _send_message(
+        self, message: Dict[str, Any], *, encoded: Optional[bytes] = None
+    ) -> bool:
+        """Send a message to the WebSocket server.
+
+        ``encoded`` may carry the already serialised frame for ``message``
+        (including its nonce); it is sent as-is instead of re-encoding.
+        """
         if not self.websocket or not self.connection_established:
             # If we're already reconnecting, wait for it to complete instead of starting a new one
             if self._reconnecting:
@@ -1001,15 +1397,11 @@ class PettWebSocketClient:
                     logger.error(
                         "WebSocket still not connected after waiting for reconnection"
                     )
-                    if self._telemetry_recorder:
-                        try:
-                            self._telemetry_recorder(
-                                message,
-                                False,
-                                "WebSocket not connected after reconnection wait",
-                            )
-                        except Exception:
-                            pass
+                    self._record_telemetry(
+                        message,
+                        False,
+                        "WebSocket not connected after reconnection wait",
+                    )
                     return False
             else:
                 logger.error("WebSocket not connected")
@@ -1018,56 +1410,40 @@ class PettWebSocketClient:
                     logger.info("🔄 Attempting to reconnect before sending message...")
                     reconnected = await self._ensure_connected()
                     if not reconnected:
-                        if self._telemetry_recorder:
-                            try:
-                                self._telemetry_recorder(
-                                    message, False, "WebSocket not connected"
-                                )
-                            except Exception:
-                                pass
+                        self._record_telemetry(
+                            message, False, "WebSocket not connected"
+                        )
                         return False
                 else:
-                    if self._telemetry_recorder:
-                        try:
-                            self._telemetry_recorder(
-                                message, False, "WebSocket not connected"
-                            )
-                        except Exception:
-                            pass
+                    self._record_telemetry(message, False, "WebSocket not connected")
                     return False
 
         try:
             # Ensure a nonce is present on every outgoing message
             if "nonce" not in message:
                 message["nonce"] = self._generate_nonce()
-            message_json = json.dumps(message)
-            await self.websocket.send(message_json)
-            logger.info(f"📤 Sent message type: {message['type']}")
-            if message.get("type") != "AUTH":
-                logger.info(f"📤 Message content: {message_json}")
-
-            if self._telemetry_recorder:
-                try:
-                    self._telemetry_recorder(message, True, None)
-                except Exception:
-                    pass
+            payload = encoded if encoded is not None else _json_dumps(message)
+            # Pre-encoded UTF-8 goes out as a text frame via the sender task
+            await self._write_frame(payload)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📤 Sent message type: %s", message["type"])
+                if message.get("type") != "AUTH":
+                    logger.debug("📤 Message content: %s", payload.decode())
+
+            self._record_telemetry(message, True, None)
             return True
         except (
             websockets.exceptions.ConnectionClosed,
             websockets.exceptions.InvalidState,
         ) as e:
             error_str = str(e)
-            logger.error(f"WebSocket connection error: {e}")
+            logger.error("WebSocket connection error: %s", e)
             # Mark connection as dead
             self.connection_established = False
             self.authenticated = False
 
             # Check if it's a keepalive timeout (1011) or connection closed
-            if (
-                "1011" in error_str
-                or "keepalive" in error_str.lower()
-                or "ping timeout" in error_str.lower()
-            ):
+            if _KEEPALIVE_ERROR_RE.search(error_str):
                 logger.warning(
                     "🔄 Keepalive timeout detected - connection appears dead, will reconnect"
                 )
@@ -1081,44 +1457,36 @@ class PettWebSocketClient:
                     try:
                         if "nonce" not in message:
                             message["nonce"] = self._generate_nonce()
-                        message_json = json.dumps(message)
-                        await self.websocket.send(message_json)
+                        payload = (
+                            encoded if encoded is not None else _json_dumps(message)
+                        )
+                        await self._write_frame(payload)
                         logger.info(
-                            f"📤 Sent message type: {message['type']} after reconnection"
+                            "📤 Sent message type: %s after reconnection",
+                            message["type"],
                         )
-                        if message.get("type") != "AUTH":
-                            logger.info(f"📤 Message content: {message_json}")
-                        if self._telemetry_recorder:
-                            try:
-                                self._telemetry_recorder(message, True, None)
-                            except Exception:
-                                pass
+                        if message.get("type") != "AUTH" and logger.isEnabledFor(
+                            logging.DEBUG
+                        ):
+                            logger.debug("📤 Message content: %s", payload.decode())
+                        self._record_telemetry(message, True, None)
                         return True
                     except Exception as retry_e:
                         logger.error(
-                            f"Failed to send message after reconnection: {retry_e}"
+                            "Failed to send message after reconnection: %s", retry_e
                         )
             elif self._reconnecting:
                 logger.debug(
                     "Reconnection already in progress, skipping duplicate attempt"
                 )
 
-            if self._telemetry_recorder:
-                try:
-                    self._telemetry_recorder(message, False, str(e))
-                except Exception:
-                    pass
+            self._record_telemetry(message, False, str(e))
             return False
         except Exception as e:
             error_str = str(e)
-            logger.error(f"Failed to send message: {e}")
+            logger.error("Failed to send message: %s", e)
             # Check for connection-related errors in the exception message
-            if (
-                "1011" in error_str
-                or "keepalive" in error_str.lower()
-                or "ping timeout" in error_str.lower()
-                or "connection" in error_str.lower()
-            ):
+            if _CONNECTION_ERROR_RE.search(error_str):
                 # Mark connection as dead
                 self.connection_established = False
                 self.authenticated = False
@@ -1134,11 +1502,7 @@ class PettWebSocketClient:
                         "Reconnection already in progress, skipping duplicate attempt"
                     )
 
-            if self._telemetry_recorder:
-                try:
-                    self._telemetry_recorder(message, False, str(e))
-                except Exception:
-                    pass
+            self._record_telemetry(message, False, str(e))
             return False
 
     async def _send_and_wait(
@@ -1156,44 +1520,61 @@ class PettWebSocketClient:
         """
         # Clear last error before starting a new request
         self._last_action_error = None
+        if (
+            not self.authenticated
+            and not self.session_token
+            and self._saved_auth_type != "session"
+            and self._is_privy_token_expired()
+        ):
+            # Reconnecting would only fail authentication with the expired JWT
+            self._jwt_expired = True
+            self._last_action_error = "Privy JWT expired"
+            return False, None
+
         nonce = self._generate_nonce()
         future = self._register_pending(nonce)
 
         message: Dict[str, Any] = {
             "type": msg_type,
-            "data": data or {},
+            "data": data or _EMPTY_DATA,
             "nonce": nonce,
         }
         if verify:
             message["verify"] = True
 
-        sent = await self._send_message(message)
-        if not sent:
-            # Clean up pending future
-            try:
-                if nonce in self._pending_nonces:
-                    self._pending_nonces.pop(nonce, None)
-            except Exception:
-                pass
-            return False, None
-
         try:
-            response: Dict[str, Any] = await asyncio.wait_for(future, timeout=timeout)
-        except asyncio.TimeoutError:
-            # No correlated error arrived within the window; assume success
-            logger.info(
-                f"⏱️ No error received within {timeout}s for {msg_type} (nonce {nonce}); assuming success"
-            )
-            return True, None
-        except Exception as e:
-            logger.error(
-                f"❌ Error awaiting response for {msg_type} (nonce {nonce}): {e}"
-            )
+            sent = await self._send_message(message)
+            if not sent:
+                return False, None
+
             try:
-                self._last_action_error = str(e)
-            except Exception:
-                pass
-            return False, None
+                async with _async_timeout(timeout):
+                    response: Dict[str, Any] = await future
+            except asyncio.TimeoutError:
+                # No correlated error arrived within the window; assume success
+                logger.info(
+                    "⏱️ No error received within %ss for %s (nonce %s); assuming success",
+                    timeout,
+                    msg_type,
+                    nonce,
+                )
+                return True, None
+            except Exception as e:
+                logger.error(
+                    "❌ Error awaiting response for %s (nonce %s): %s",
+                    msg_type,
+                    nonce,
+                    e,
+                )
+                try:
+                    self._last_action_error = str(e)
+                except Exception:
+                    pass
+                return False, None
+        finally:
+            # Free the ring slot on failure, timeout or caller cancellation
+            # (a no-op once the listener has popped it to deliver the response)
+            self._pop_pending(nonce)
 
         # Treat explicit error type as failure
         if isinstance(response, dict) and (response.get("type") == "error"):
@@ -1214,7 +1595,7 @@ class PettWebSocketClient:
         try:
             if not isinstance(message, dict):
                 return None
-            data = message.get("data", {})
+            data = message.get("data") or _EMPTY
             verification = data.get("verification")
             if isinstance(verification, dict):
                 return verification
@@ -1227,34 +1608,63 @@ class PettWebSocketClient:
         try:
             if not isinstance(message, dict):
                 return False
-            err = message.get("error") or message.get("data", {}).get("error")
+            err = message.get("error") or (message.get("data") or _EMPTY).get("error")
             if not err:
                 return False
             return "already clean" in str(err).lower()
         except Exception:
             return False
 
-    async def listen_for_messages(self) -> None:
-        """Listen for incoming messages from the server."""
-        if not self.websocket or not self.connection_established:
-            logger.error("❌ WebSocket not connected - cannot listen for messages")
+    def _ensure_listener(self) -> None:
+        """Start the shared listener task unless it is already running."""
+        if self._listener_task and not self._listener_task.done():
             return
+        self._ws_ready = asyncio.Event()
+        if self.websocket is not None and self.connection_established:
+            self._ws_ready.set()
+        self._listener_task = asyncio.create_task(self.listen_for_messages())
 
+    async def listen_for_messages(self) -> None:
+        """Listen for incoming messages from the server.
+
+        Runs for the lifetime of the client: when the current socket closes it
+        waits for connect() to publish the next one instead of exiting.
+        """
+        if self._ws_ready is None:
+            self._ws_ready = asyncio.Event()
+        ws_ready = self._ws_ready
         logger.info("👂 Starting WebSocket message listener...")
+        while True:
+            websocket = self.websocket
+            if websocket is None or not self.connection_established:
+                ws_ready.clear()
+                await ws_ready.wait()
+                continue
+            await self._receive_until_closed(websocket)
+
+    async def _receive_until_closed(self, websocket: Any) -> None:
+        """Dispatch frames from ``websocket`` until it closes or fails."""
         try:
-            async for message in self.websocket:
+            while True:
+                # Receive undecoded frames; the JSON parser consumes bytes directly
+                message = await websocket.recv(decode=False)
+                if not self._frame_has_consumer(message):
+                    continue
                 try:
-                    message_data = json.loads(message)
+                    message_data = _json_loads(message)
                     await self._handle_message(message_data)
                 except json.JSONDecodeError as e:
-                    logger.error(f"❌ Failed to parse WebSocket message: {e}")
-                    logger.error(f"❌ Raw message: {message}")
+                    logger.error("❌ Failed to parse WebSocket message: %s", e)
+                    logger.error("❌ Raw message: %s", message)
                 except Exception as e:
-                    logger.error(f"❌ Error handling WebSocket message: {e}")
+                    logger.error("❌ Error handling WebSocket message: %s", e)
 
         except websockets.exceptions.ConnectionClosed as e:
+            if websocket is not self.websocket:
+                # Closed by disconnect() or replaced by a newer connection
+                return
             logger.warning(
-                f"⚠️ WebSocket connection closed during message listening: {e}"
+                "⚠️ WebSocket connection closed during message listening: %s", e
             )
             self.connection_established = False
             self.authenticated = False
@@ -1264,22 +1674,38 @@ class PettWebSocketClient:
                     "🔄 Connection closed in listener, will attempt reconnection on next message"
                 )
         except Exception as e:
+            if websocket is not self.websocket:
+                return
             error_str = str(e)
-            logger.error(f"❌ Error in WebSocket message listener: {e}")
+            logger.error("❌ Error in WebSocket message listener: %s", e)
             self.connection_established = False
             self.authenticated = False
             # Check if it's a connection-related error
-            if (
-                "1011" in error_str
-                or "keepalive" in error_str.lower()
-                or "ping timeout" in error_str.lower()
-            ):
+            if _KEEPALIVE_ERROR_RE.search(error_str):
                 logger.warning(
                     "⚠️ Keepalive timeout in listener - connection appears dead"
                 )
                 if self._has_any_auth_token():
                     logger.info("🔄 Will attempt reconnection on next message")
 
+    def _frame_has_consumer(self, frame: bytes) -> bool:
+        """Return True if a raw frame needs a full JSON parse.
+
+        Frames carrying a nonce may resolve a pending request. Otherwise the
+        frame is only parsed when one of its "type" values (nested ones
+        included, so the top-level type is always covered) has a handler.
+        """
+        if b'"nonce"' in frame:
+            return True
+        for raw_type in _FRAME_TYPE_RE.findall(frame):
+            message_type = raw_type.decode("utf-8", "replace")
+            if (
+                message_type in self._builtin_dispatch
+                or message_type in self.message_handlers
+            ):
+                return True
+        return False
+
     async def _handle_message(self, message: Dict[str, Any]) -> None:
         """Handle incoming messages from the server."""
         message_type = message.get("type")
@@ -1288,42 +1714,28 @@ class PettWebSocketClient:
             self._resolve_pending(message.get("nonce"), message)
         except Exception:
             pass
-        if message_type == "auth_result":
-            await self._handle_auth_result(message)
-        elif message_type == "pet_update":
-            await self._handle_pet_update(message)
-        elif message_type == "error":
-            await self._handle_error(message)
-        elif message_type == "data":
-            await self._handle_data(message)
+        builtin_handler = self._builtin_dispatch.get(message_type)
+        if builtin_handler is not None:
+            await builtin_handler(message)
 
         # Call registered handlers
-        if message_type in self.message_handlers:
-            for handler in self.message_handlers[message_type]:
-                try:
-                    await handler(message)
-                except Exception as e:
-                    logger.error(f"Error in message handler: {e}")
+        for handler in self.message_handlers.get(message_type, ()):
+            try:
+                await handler(message)
+            except Exception as e:
+                logger.error("Error in message handler: %s", e)
 
     async def _handle_auth_result(self, message: Dict[str, Any]) -> None:
         """Handle authentication result message."""
         # Handle both message structures: with and without 'data' wrapper
-        if "data" in message:
-            data = message.get("data", {})
-            success = data.get("success", False)
-            error = data.get("error", "Unknown error")
-            user_data = data.get("user", {})
-            pet_data = data.get("pet", {})
-            session_token = data.get("sessionToken")
-            session_expires_at = data.get("sessionExpiresAt")
-        else:
-            # Direct structure: {'type': 'auth_result', 'success': False, 'error': '...'}
-            success = message.get("success", False)
-            error = message.get("error", "Unknown error")
-            user_data = message.get("user", {})
-            pet_data = message.get("pet", {})
-            session_token = message.get("sessionToken")
-            session_expires_at = message.get("sessionExpiresAt")
+        # (direct: {'type': 'auth_result', 'success': False, 'error': '...'})
+        data = message.get("data") or message
+        success = data.get("success", False)
+        error = data.get("error", "Unknown error")
+        user_data = data.get("user") or _EMPTY
+        pet_data = data.get("pet") or _EMPTY
+        session_token = data.get("sessionToken")
+        session_expires_at = data.get("sessionExpiresAt")
 
         if success:
             self.authenticated = True
@@ -1387,12 +1799,15 @@ class PettWebSocketClient:
 
             else:
                 self.pet_data = {}
-                logger.info("✅ Authentication successful but no pet found")
-                logger.info(f"👤 User: {user_data.get('id', 'Unknown')}")
-                logger.info(f"🔑 Privy ID: {user_data.get('privyID', 'Unknown')}")
-                logger.info(f"📱 Telegram ID: {user_data.get('telegramID', 'Unknown')}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("✅ Authentication successful but no pet found")
+                    logger.info("👤 User: %s", user_data.get("id", "Unknown"))
+                    logger.info("🔑 Privy ID: %s", user_data.get("privyID", "Unknown"))
+                    logger.info(
+                        "📱 Telegram ID: %s", user_data.get("telegramID", "Unknown")
+                    )
         else:
-            logger.error(f"❌ Authentication failed: {error}")
+            logger.error("❌ Authentication failed: %s", error)
             self.authenticated = False
 
             # Store the error for retry logic
@@ -1426,96 +1841,74 @@ class PettWebSocketClient:
                 )
 
         # Resolve the auth future if it exists
-        if self.auth_future and not self.auth_future.done():
-            self.auth_future.set_result(success)
+        if self.auth_future is not None:
+            self._settle(self.auth_future, success)
 
         self._pending_auth_token = None
         self._pending_auth_type = None
 
-    def _merge_pet_data(
-        self, base: Dict[str, Any], new: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Merge new pet data into existing data, preserving nested fields when missing.
+    def _merge_pet_data(self, base: Dict[str, Any], new: Dict[str, Any]) -> None:
+        """Merge new pet data into ``base`` in place, preserving nested fields when missing.
 
         - Only overwrite keys present in the new payload
         - For dict values (e.g., PetStats, PetTokens), perform a shallow merge
         - Preserve existing PetStats if the new payload lacks it or it is empty
         """
-        if not isinstance(base, dict):
-            base = {}
-
-        merged: Dict[str, Any] = dict(base)
+        if not isinstance(new, dict):
+            return
 
-        for key, new_value in (new or {}).items():
+        for key, new_value in new.items():
+            is_dict = isinstance(new_value, dict)
             # Special handling for PetStats: ignore empty updates
-            if key == "PetStats":
-                if isinstance(new_value, dict) and new_value:
-                    old_stats = merged.get("PetStats", {})
-                    if isinstance(old_stats, dict):
-                        # Shallow merge stats
-                        updated_stats = dict(old_stats)
-                        updated_stats.update(new_value)
-                        merged["PetStats"] = updated_stats
-                    else:
-                        merged["PetStats"] = new_value
-                else:
-                    # Skip overwriting existing stats with empty/none
-                    continue
+            if key == "PetStats" and not (is_dict and new_value):
                 continue
 
             # Generic shallow merge for nested dicts
-            if isinstance(new_value, dict) and isinstance(merged.get(key), dict):
-                updated_dict = dict(merged.get(key) or {})
-                updated_dict.update(new_value)
-                merged[key] = updated_dict
+            old_value = base.get(key)
+            if is_dict and isinstance(old_value, dict):
+                old_value.update(new_value)
             else:
-                merged[key] = new_value
-
-        return merged
+                base[key] = new_value
 
     async def _handle_pet_update(self, message: Dict[str, Any]) -> None:
         """Handle pet update message."""
         # Handle both message structures: with and without 'data' wrapper
-        if "data" in message:
-            data = message.get("data", {})
-            user_data = data.get("user", {})
-            pet_data = data.get("pet", {})
-        else:
-            # Direct structure
-            user_data = message.get("user", {})
-            pet_data = message.get("pet", {})
+        data = message.get("data") or message
+        user_data = data.get("user") or _EMPTY
+        pet_data = data.get("pet") or _EMPTY
 
         # Update pet data
         if pet_data:
             # Merge with existing data to avoid losing fields on partial updates
             if self.pet_data and isinstance(self.pet_data, dict):
-                merged = self._merge_pet_data(self.pet_data, pet_data)
-                # If pet id changes, prefer new payload entirely
                 old_id = self.pet_data.get("id")
-                new_id = pet_data.get("id")
-                self.pet_data = merged if not old_id or old_id == new_id else pet_data
+                if not old_id or old_id == pet_data.get("id"):
+                    self._merge_pet_data(self.pet_data, pet_data)
+                else:
+                    # If pet id changes, prefer new payload entirely
+                    self.pet_data = pet_data
                 logger.info("Pet Status updated (merged partial update)")
             else:
                 self.pet_data = pet_data
                 logger.info("Pet Status updated")
-            logger.info(f"Updated pet data: {self.pet_data}")
+            logger.debug("Updated pet data: %s", self.pet_data)
         elif user_data:
             # If we got user data, extract pet from it
             pets = user_data.get("pets", [])
             if pets:
                 pet_from_user = pets[0]
                 if self.pet_data and isinstance(self.pet_data, dict):
-                    self.pet_data = self._merge_pet_data(self.pet_data, pet_from_user)
+                    self._merge_pet_data(self.pet_data, pet_from_user)
                     logger.info("Pet updated from user data (merged)")
                 else:
                     self.pet_data = pet_from_user
                     logger.info("Pet updated from user data")
-                logger.info(f"Updated pet data: {self.pet_data}")
+                logger.debug("Updated pet data: %s", self.pet_data)
 
     async def _handle_error(self, message: Dict[str, Any]) -> None:
         """Handle error message."""
         error = message.get("error")
-        logger.error(f"Server error: {error}")
+        logger.error("Server error: %s", error)
         try:
             if error is not None:
                 self._last_action_error = str(error)
@@ -1525,67 +1918,49 @@ class PettWebSocketClient:
     async def _handle_data(self, message: Dict[str, Any]) -> None:
         """Handle data message."""
         self.data_message = message
-        logger.info("📊 Received data message")
-        logger.info(f"Data message: {message}")
+        data = message.get("data") or _EMPTY
+        logger.debug("📊 Received data message: %s", message)
 
-        # Handle AI search results
-        if self.ai_search_future and not self.ai_search_future.done():
-            try:
-                # Extract AI search result from the message
-                ai_result = message.get("data", {}).get("result", "")
-                if ai_result:
-                    self.ai_search_future.set_result(ai_result)
-                else:
-                    self.ai_search_future.set_result("No search results found")
-            except Exception as e:
-                logger.error(f"Error handling AI search result: {e}")
-                if not self.ai_search_future.done():
-                    self.ai_search_future.set_result(
-                        f"Error processing search result: {str(e)}"
-                    )
-
-        # Handle kitchen data
-        if self.kitchen_future and not self.kitchen_future.done():
-            try:
-                kitchen_data = message.get("data", {})
-                if kitchen_data:
-                    self.kitchen_future.set_result(json.dumps(kitchen_data, indent=2))
-                else:
-                    self.kitchen_future.set_result("No kitchen data found")
-            except Exception as e:
-                logger.error(f"Error handling kitchen data: {e}")
-                if not self.kitchen_future.done():
-                    self.kitchen_future.set_result(
-                        f"Error processing kitchen data: {str(e)}"
-                    )
-
-        # Handle mall data
-        if self.mall_future and not self.mall_future.done():
-            try:
-                mall_data = message.get("data", {})
-                if mall_data:
-                    self.mall_future.set_result(json.dumps(mall_data, indent=2))
-                else:
-                    self.mall_future.set_result("No mall data found")
-            except Exception as e:
-                logger.error(f"Error handling mall data: {e}")
-                if not self.mall_future.done():
-                    self.mall_future.set_result(f"Error processing mall data: {str(e)}")
-
-        # Handle closet data
-        if self.closet_future and not self.closet_future.done():
-            try:
-                closet_data = message.get("data", {})
-                if closet_data:
-                    self.closet_future.set_result(json.dumps(closet_data, indent=2))
-                else:
-                    self.closet_future.set_result("No closet data found")
-            except Exception as e:
-                logger.error(f"Error handling closet data: {e}")
-                if not self.closet_future.done():
-                    self.closet_future.set_result(
-                        f"Error processing closet data: {str(e)}"
-                    )
+        entry = self._claim_inflight(message.get("nonce"), "result" in data)
+        if entry is None:
+            return
+        msg_type, future = entry
+        try:
+            if msg_type == "AI_SEARCH":
+                result = data.get("result", "") or "No search results found"
+            elif not data:
+                result = f"No {_DATA_REQUEST_LABELS.get(msg_type, msg_type)} data found"
+            else:
+                result = _json_dumps(data).decode("utf-8")
+        except Exception as e:
+            if msg_type == "AI_SEARCH":
+                logger.error("Error handling AI search result: %s", e)
+                result = f"Error processing search result: {str(e)}"
+            else:
+                label = _DATA_REQUEST_LABELS.get(msg_type, msg_type)
+                logger.error("Error handling %s data: %s", label, e)
+                result = f"Error processing {label} data: {str(e)}"
+        self._settle(future, result)
+
+    def _claim_inflight(
+        self, nonce: Any, is_search_result: bool
+    ) -> Optional[Tuple[str, asyncio.Future[str]]]:
+        """Pop the data request a "data" frame answers, if any.
+
+        Correlated frames match by nonce. A frame without a nonce goes to the
+        oldest waiting request of the matching kind (AI search results carry a
+        "result" field), so one frame never resolves several requests.
+
+        Kitchen, mall and closet payloads carry nothing that names their kind,
+        so uncorrelated frames are matched in request order only: a mall reply
+        without a nonce still resolves an older waiting closet request.
+        """
+        if nonce is not None:
+            return self._inflight.pop(str(nonce), None)
+        for request_nonce, (msg_type, _) in self._inflight.items():
+            if (msg_type == "AI_SEARCH") == is_search_result:
+                return self._inflight.pop(request_nonce)
+        return None
 
     def register_message_handler(self, message_type: str, handler: Callable) -> None:
         """Register a handler for a specific message type."""
@@ -1594,43 +1969,38 @@ class PettWebSocketClient:
         self.message_handlers[message_type].append(handler)
 
     # Pet action methods
-    async def rub_pet(self, *, record_on_chain: Optional[bool] = None) -> bool:
-        """Rub the pet."""
+    async def _do_simple_action(
+        self, kind: str, record_on_chain: Optional[bool] = None
+    ) -> bool:
+        """Send a parameterless pet action described by ``_SIMPLE_ACTIONS``."""
+        timeout, record_if_clean, record_log = _SIMPLE_ACTIONS[kind]
         record = (
             self._onchain_recording_enabled
             if record_on_chain is None
             else bool(record_on_chain)
         )
         success, response = await self._send_and_wait(
-            "RUB", {}, timeout=10, verify=record
+            kind, None, timeout=timeout, verify=record
         )
-        verification = self._extract_verification(response)
-        if success or (not success and self._contains_already_clean_error(response)):
-            if verification and record:
-                logger.info(
-                    "🧾 RUB: submitting verified on-chain record (success or already clean)"
-                )
-                self._schedule_verified_record_action("RUB", verification)
+        if not success and not (
+            record_if_clean and self._contains_already_clean_error(response)
+        ):
+            return False
+        if record:
+            verification = self._extract_verification(response)
+            if verification:
+                if record_log:
+                    logger.info(record_log)
+                self._schedule_verified_record_action(kind, verification)
         return bool(success)
 
+    async def rub_pet(self, *, record_on_chain: Optional[bool] = None) -> bool:
+        """Rub the pet."""
+        return await self._do_simple_action("RUB", record_on_chain)
+
     async def shower_pet(self, *, record_on_chain: Optional[bool] = None) -> bool:
         """Give the pet a shower."""
-        record = (
-            self._onchain_recording_enabled
-            if record_on_chain is None
-            else bool(record_on_chain)
-        )
-        success, response = await self._send_and_wait(
-            "SHOWER", {}, timeout=10, verify=record
-        )
-        verification = self._extract_verification(response)
-        if success or (not success and self._contains_already_clean_error(response)):
-            if verification and record:
-                logger.info(
-                    "🧾 SHOWER: submitting verified on-chain record (success or already clean)"
-                )
-                self._schedule_verified_record_action("SHOWER", verification)
-        return bool(success)
+        return await self._do_simple_action("SHOWER", record_on_chain)
 
     async def sleep_pet(self, record_on_chain: Optional[bool] = None) -> bool:
         """Put the pet to sleep."""
@@ -1640,7 +2010,7 @@ class PettWebSocketClient:
             else bool(record_on_chain)
         )
         success, response = await self._send_and_wait(
-            "SLEEP", {}, timeout=10, verify=record
+            "SLEEP", timeout=10, verify=record
         )
         if not success:
             return False
@@ -1668,44 +2038,29 @@ class PettWebSocketClient:
 
     async def throw_ball(self, *, record_on_chain: Optional[bool] = None) -> bool:
         """Throw a ball for the pet."""
-        record = (
-            self._onchain_recording_enabled
-            if record_on_chain is None
-            else bool(record_on_chain)
-        )
-        success, response = await self._send_and_wait(
-            "THROWBALL", {}, timeout=10, verify=record
-        )
-        if success:
-            verification = self._extract_verification(response)
-            if verification and record:
-                logger.info(
-                    "✅ THROWBALL action confirmed; submitting verified on-chain record"
-                )
-                self._schedule_verified_record_action("THROWBALL", verification)
-        return bool(success)
+        return await self._do_simple_action("THROWBALL", record_on_chain)
 
     async def use_consumable(
         self, consumable_id: str, *, record_on_chain: Optional[bool] = None
     ) -> bool:
         """Use a consumable item."""
-        if not consumable_id or not consumable_id.strip():
-            logger.error(f"Invalid consumable ID provided: {consumable_id!r}")
+        stripped_id = (consumable_id or "").strip()
+        if not stripped_id:
+            logger.error("Invalid consumable ID provided: %r", consumable_id)
             return False
 
-        consumable_id = consumable_id.strip().strip('"').strip("'")
-        logger.info(f"🍴 Using consumable: {consumable_id}")
+        consumable_id = stripped_id.strip('"').strip("'")
+        logger.info("🍴 Using consumable: %s", consumable_id)
 
         record = (
             self._onchain_recording_enabled
             if record_on_chain is None
             else bool(record_on_chain)
         )
+        # Built once and reused by the retry-after-buy path below
+        use_data = {"params": {"foodId": consumable_id}}
         success, response = await self._send_and_wait(
-            "CONSUMABLES_USE",
-            {"params": {"foodId": consumable_id}},
-            timeout=15,
-            verify=record,
+            "CONSUMABLES_USE", use_data, timeout=15, verify=record
         )
 
         if success:
@@ -1717,26 +2072,22 @@ class PettWebSocketClient:
         # Check for rate limiting errors
         error_text = ""
         if isinstance(response, dict):
-            error_text = str(response.get("error", ""))
+            error_text = str(response.get("error", "")).lower()
 
         # Handle rate limiting with exponential backoff
-        if error_text and (
-            "too quickly" in error_text.lower() or "rate limit" in error_text.lower()
-        ):
+        if error_text and ("too quickly" in error_text or "rate limit" in error_text):
             logger.warning(
-                f"⏳ Rate limited when using {consumable_id}. Waiting before retry..."
+                "⏳ Rate limited when using %s. Waiting before retry...", consumable_id
             )
             await asyncio.sleep(2.0)  # Wait 2 seconds before returning False
             return False
 
-        # If use failed (but not rate limited), wait before any retry to avoid rate limiting
-        if not success:
-            await asyncio.sleep(1.0)
-
-        # Attempt auto-buy on "not found" error then retry once
-        if error_text and ("not found" in error_text.lower()):
+        # Attempt auto-buy on "not found" error then retry once. The BUY goes out
+        # straight away (it is a different action); only the retried USE is spaced
+        if error_text and "not found" in error_text:
             logger.info(
-                f"🛒 Consumable {consumable_id} not owned. Attempting to buy one and retry."
+                "🛒 Consumable %s not owned. Attempting to buy one and retry.",
+                consumable_id,
             )
             buy_success, _ = await self._send_and_wait(
                 "CONSUMABLES_BUY",
@@ -1745,19 +2096,17 @@ class PettWebSocketClient:
             )
             if not buy_success:
                 logger.warning(
-                    f"❌ Failed to buy missing consumable {consumable_id}; will not retry use."
+                    "❌ Failed to buy missing consumable %s; will not retry use.",
+                    consumable_id,
                 )
                 return False
 
             # Wait before retrying use after purchase to avoid rate limiting
             await asyncio.sleep(1.0)
             # Retry once after successful buy
-            logger.info(f"🔁 Retrying use of {consumable_id} after purchase")
+            logger.info("🔁 Retrying use of %s after purchase", consumable_id)
             retry_success, retry_resp = await self._send_and_wait(
-                "CONSUMABLES_USE",
-                {"params": {"foodId": consumable_id}},
-                timeout=15,
-                verify=record,
+                "CONSUMABLES_USE", use_data, timeout=15, verify=record
             )
             if retry_success:
                 verification2 = self._extract_verification(retry_resp)
@@ -1767,6 +2116,8 @@ class PettWebSocketClient:
                     )
             return bool(retry_success)
 
+        # Use failed (but not rate limited): wait before any caller retry
+        await asyncio.sleep(1.0)
         return False
 
     async def buy_consumable(
@@ -1787,7 +2138,8 @@ class PettWebSocketClient:
                 "ACCOUNTANT"
             amount: The number of consumables to buy (default: 1).
         """
-        if not consumable_id or not consumable_id.strip():
+        stripped_id = (consumable_id or "").strip()
+        if not stripped_id:
             logger.error("Invalid consumable ID provided")
             return False
 
@@ -1796,7 +2148,7 @@ class PettWebSocketClient:
             return False
 
         # Normalize the ID to avoid accidental surrounding quotes
-        consumable_id = consumable_id.strip().strip('"').strip("'")
+        consumable_id = stripped_id.strip('"').strip("'")
         record = (
             self._onchain_recording_enabled
             if record_on_chain is None
@@ -1818,7 +2170,8 @@ class PettWebSocketClient:
                 or "rate limit" in error_text.lower()
             ):
                 logger.warning(
-                    f"⏳ Rate limited when buying {consumable_id}. Waiting before returning..."
+                    "⏳ Rate limited when buying %s. Waiting before returning...",
+                    consumable_id,
                 )
                 await asyncio.sleep(2.0)  # Wait 2 seconds before returning False
 
@@ -1831,7 +2184,7 @@ class PettWebSocketClient:
     async def get_consumables(self) -> bool:
         """Get available consumables."""
         logger.info("[TOOL] Getting consumables")
-        success, _ = await self._send_and_wait("CONSUMABLES_GET", {}, timeout=10)
+        success, _ = await self._send_and_wait("CONSUMABLES_GET", timeout=10)
         return bool(success)
 
     async def fetch_consumables_inventory(
@@ -1840,7 +2193,7 @@ class PettWebSocketClient:
         """Return the structured list of owned consumables via CONSUMABLES_GET."""
 
         success, response = await self._send_and_wait(
-            "CONSUMABLES_GET", {}, timeout=timeout
+            "CONSUMABLES_GET", timeout=timeout
         )
         if not success:
             logger.warning("❌ Failed to fetch consumables inventory")
@@ -1867,56 +2220,76 @@ class PettWebSocketClient:
         return inventory
 
     async def get_kitchen(self) -> bool:
-        """Get kitchen information."""
-        success, _ = await self._send_and_wait("KITCHEN_GET", {}, timeout=10)
-        return bool(success)
+        """Request kitchen information without waiting for the server's reply."""
+        return await self._send_message({"type": "KITCHEN_GET", "data": _EMPTY_DATA})
 
-    async def get_kitchen_data(self, timeout: int = 10) -> str:
-        """Get kitchen information and wait for the result.
+    async def _request_and_await_future(
+        self,
+        msg_type: str,
+        data: Optional[Dict[str, Any]] = None,
+        *,
+        timeout: int = 10,
+        label: str,
+    ) -> str:
+        """Send ``msg_type`` and wait for ``_handle_data`` to resolve its future.
 
         Args:
-            timeout: Maximum time to wait for response in seconds (default: 10)
+            msg_type: Server message type to send
+            data: Optional message payload (defaults to an empty dict)
+            timeout: Maximum time to wait for response in seconds
+            label: Human-readable request name used in logs and error strings
 
         Returns:
-            The kitchen data as a JSON string, or error message if failed
+            The response text, or error message if failed
         """
+        nonce = self._generate_nonce()
         try:
-            # Create a future to wait for the kitchen data
-            self.kitchen_future = asyncio.Future()
+            future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+            self._inflight[nonce] = (msg_type, future)
 
-            # Send the kitchen request
-            success = await self._send_message({"type": "KITCHEN_GET", "data": {}})
+            success = await self._send_message(
+                {"type": msg_type, "data": data or _EMPTY_DATA, "nonce": nonce}
+            )
 
             if not success:
-                return "❌ Failed to send kitchen request"
+                return f"❌ Failed to send {label}"
 
-            logger.info("[TOOL] Sent kitchen request")
-            logger.info(f"[TOOL] Waiting up to {timeout} seconds for response...")
+            logger.info("[TOOL] Sent %s", label)
+            logger.info("[TOOL] Waiting up to %s seconds for response...", timeout)
 
-            # Wait for the result with timeout
             try:
-                result: str = await asyncio.wait_for(
-                    self.kitchen_future, timeout=timeout
-                )
-                return result
+                async with _async_timeout(timeout):
+                    return await future
 
             except asyncio.TimeoutError:
-                logger.warning(
-                    f"[TOOL] Kitchen request timed out after {timeout} seconds"
+                logger.warning("[TOOL] %s timed out after %s seconds", label, timeout)
+                return (
+                    f"❌ {label[:1].upper()}{label[1:]} timed out after "
+                    f"{timeout} seconds. Please try again."
                 )
-                return f"❌ Kitchen request timed out after {timeout} seconds. Please try again."
 
         except Exception as e:
-            logger.error(f"[TOOL] Error during kitchen request: {e}")
-            return f"❌ Error during kitchen request: {str(e)}"
+            logger.error("[TOOL] Error during %s: %s", label, e)
+            return f"❌ Error during {label}: {str(e)}"
         finally:
-            # Clean up the future
-            self.kitchen_future = None
+            self._inflight.pop(nonce, None)
+
+    async def get_kitchen_data(self, timeout: int = 10) -> str:
+        """Get kitchen information and wait for the result.
+
+        Args:
+            timeout: Maximum time to wait for response in seconds (default: 10)
+
+        Returns:
+            The kitchen data as a JSON string, or error message if failed
+        """
+        return await self._request_and_await_future(
+            "KITCHEN_GET", timeout=timeout, label="kitchen request"
+        )
 
     async def get_mall(self) -> bool:
-        """Get mall information."""
-        success, _ = await self._send_and_wait("MALL_GET", {}, timeout=10)
-        return bool(success)
+        """Request mall information without waiting for the server's reply."""
+        return await self._send_message({"type": "MALL_GET", "data": _EMPTY_DATA})
 
     async def get_mall_data(self, timeout: int = 10) -> str:
         """Get mall information and wait for the result.
@@ -1927,39 +2300,13 @@ class PettWebSocketClient:
         Returns:
             The mall data as a JSON string, or error message if failed
         """
-        try:
-            # Create a future to wait for the mall data
-            self.mall_future = asyncio.Future()
-
-            # Send the mall request
-            success = await self._send_message({"type": "MALL_GET", "data": {}})
-
-            if not success:
-                return "❌ Failed to send mall request"
-
-            logger.info("[TOOL] Sent mall request")
-            logger.info(f"[TOOL] Waiting up to {timeout} seconds for response...")
-
-            # Wait for the result with timeout
-            try:
-                result: str = await asyncio.wait_for(self.mall_future, timeout=timeout)
-                return result
-
-            except asyncio.TimeoutError:
-                logger.warning(f"[TOOL] Mall request timed out after {timeout} seconds")
-                return f"❌ Mall request timed out after {timeout} seconds. Please try again."
-
-        except Exception as e:
-            logger.error(f"[TOOL] Error during mall request: {e}")
-            return f"❌ Error during mall request: {str(e)}"
-        finally:
-            # Clean up the future
-            self.mall_future = None
+        return await self._request_and_await_future(
+            "MALL_GET", timeout=timeout, label="mall request"
+        )
 
     async def get_closet(self) -> bool:
-        """Get closet information."""
-        success, _ = await self._send_and_wait("CLOSET_GET", {}, timeout=10)
-        return bool(success)
+        """Request closet information without waiting for the server's reply."""
+        return await self._send_message({"type": "CLOSET_GET", "data": _EMPTY_DATA})
 
     async def get_closet_data(self, timeout: int = 10) -> str:
         """Get closet information and wait for the result.
@@ -1970,47 +2317,29 @@ class PettWebSocketClient:
         Returns:
             The closet data as a JSON string, or error message if failed
         """
-        try:
-            # Create a future to wait for the closet data
-            self.closet_future = asyncio.Future()
-
-            # Send the closet request
-            success = await self._send_message({"type": "CLOSET_GET", "data": {}})
-
-            if not success:
-                return "❌ Failed to send closet request"
-
-            logger.info("[TOOL] Sent closet request")
-            logger.info(f"[TOOL] Waiting up to {timeout} seconds for response...")
-
-            # Wait for the result with timeout
-            try:
-                result: str = await asyncio.wait_for(
-                    self.closet_future, timeout=timeout
-                )
-                return result
-
-            except asyncio.TimeoutError:
-                logger.warning(
-                    f"[TOOL] Closet request timed out after {timeout} seconds"
-                )
-                return f"❌ Closet request timed out after {timeout} seconds. Please try again."
+        if not await self._ready():
+            logger.warning("[TOOL] Closet request skipped: WebSocket not ready")
+            return "❌ WebSocket not connected or token expired"
 
-        except Exception as e:
-            logger.error(f"[TOOL] Error during closet request: {e}")
-            return f"❌ Error during closet request: {str(e)}"
-        finally:
-            # Clean up the future
-            self.closet_future = None
+        return await self._request_and_await_future(
+            "CLOSET_GET", timeout=timeout, label="closet request"
+        )
 
     async def use_accessory(
         self, accessory_id: str, *, record_on_chain: Optional[bool] = None
     ) -> bool:
         """Use an accessory."""
-        if not accessory_id or not accessory_id.strip():
+        accessory_id = (accessory_id or "").strip()
+        if not accessory_id:
             logger.error("Invalid accessory ID provided")
             return False
 
+        if not await self._ready():
+            logger.warning(
+                "Skipping ACCESSORY_USE: WebSocket not connected or JWT expired"
+            )
+            return False
+
         record = (
             self._onchain_recording_enabled
             if record_on_chain is None
@@ -2018,7 +2347,7 @@ class PettWebSocketClient:
         )
         success, response = await self._send_and_wait(
             "ACCESSORY_USE",
-            {"params": {"accessoryId": accessory_id.strip()}},
+            {"params": {"accessoryId": accessory_id}},
             timeout=10,
             verify=record,
         )
@@ -2032,10 +2361,17 @@ class PettWebSocketClient:
         self, accessory_id: str, *, record_on_chain: Optional[bool] = None
     ) -> bool:
         """Buy an accessory."""
-        if not accessory_id or not accessory_id.strip():
+        accessory_id = (accessory_id or "").strip()
+        if not accessory_id:
             logger.error("Invalid accessory ID provided")
             return False
 
+        if not await self._ready():
+            logger.warning(
+                "Skipping ACCESSORY_BUY: WebSocket not connected or JWT expired"
+            )
+            return False
+
         record = (
             self._onchain_recording_enabled
             if record_on_chain is None
@@ -2043,7 +2379,7 @@ class PettWebSocketClient:
         )
         success, response = await self._send_and_wait(
             "ACCESSORY_BUY",
-            {"params": {"accessoryId": accessory_id.strip()}},
+            {"params": {"accessoryId": accessory_id}},
             timeout=10,
             verify=record,
         )
@@ -2063,47 +2399,22 @@ class PettWebSocketClient:
         Returns:
             The search result as a string, or error message if failed
         """
-        if not prompt or not prompt.strip():
+        prompt = (prompt or "").strip()
+        if not prompt:
             logger.error("Invalid search prompt provided")
             return "❌ Invalid search prompt provided"
 
-        try:
-            # Create a future to wait for the AI search result
-            self.ai_search_future = asyncio.Future()
-
-            # Send the AI search request
-            success = await self._send_message(
-                {
-                    "type": "AI_SEARCH",
-                    "data": {"params": {"prompt": prompt.strip(), "type": "web"}},
-                }
-            )
-
-            if not success:
-                return "❌ Failed to send AI search request"
-
-            logger.info(f"[TOOL] Sent AI search request: {prompt}")
-            logger.info(f"[TOOL] Waiting up to {timeout} seconds for response...")
-
-            # Wait for the result with timeout
-            try:
-                result: str = await asyncio.wait_for(
-                    self.ai_search_future, timeout=timeout
-                )
-                return result
+        if not await self._ready():
+            logger.warning("[TOOL] AI search skipped: WebSocket not ready")
+            return "❌ WebSocket not connected or token expired"
 
-            except asyncio.TimeoutError:
-                logger.warning(f"[TOOL] AI search timed out after {timeout} seconds")
-                return (
-                    f"❌ AI search timed out after {timeout} seconds. Please try again."
-                )
-
-        except Exception as e:
-            logger.error(f"[TOOL] Error during AI search: {e}")
-            return f"❌ Error during AI search: {str(e)}"
-        finally:
-            # Clean up the future
-            self.ai_search_future = None
+        logger.info("[TOOL] AI search prompt: %s", prompt)
+        return await self._request_and_await_future(
+            "AI_SEARCH",
+            {"params": {"prompt": prompt, "type": "web"}},
+            timeout=timeout,
+            label="AI search",
+        )
 
     async def proxy_llm_completion(
         self,
@@ -2142,60 +2453,40 @@ class PettWebSocketClient:
     async def get_personality(self) -> bool:
         """Get pet personality information."""
         logger.info("[TOOL] Getting pet personality information")
-        return await self._send_message({"type": "PERSONALITY_GET", "data": {}})
+        return await self._send_message(
+            {"type": "PERSONALITY_GET", "data": _EMPTY_DATA}
+        )
 
     async def generate_image(self, prompt: str) -> bool:
         """Generate an image."""
-        if not prompt or not prompt.strip():
+        prompt = (prompt or "").strip()
+        if not prompt:
             logger.error("Invalid image prompt provided")
             return False
 
         return await self._send_message(
-            {"type": "GEN_IMAGE", "data": {"params": {"prompt": prompt.strip()}}}
+            {"type": "GEN_IMAGE", "data": {"params": {"prompt": prompt}}}
         )
 
     async def hotel_check_in(self, *, record_on_chain: Optional[bool] = None) -> bool:
         """Check pet into hotel."""
         logger.info("[TOOL] Checking pet into hotel")
-        record = (
-            self._onchain_recording_enabled
-            if record_on_chain is None
-            else bool(record_on_chain)
-        )
-        success, response = await self._send_and_wait(
-            "HOTEL_CHECK_IN", {}, timeout=10, verify=record
-        )
-        if success:
-            verification = self._extract_verification(response)
-            if verification and record:
-                self._schedule_verified_record_action("HOTEL_CHECK_IN", verification)
-        return bool(success)
+        return await self._do_simple_action("HOTEL_CHECK_IN", record_on_chain)
 
     async def hotel_check_out(self, *, record_on_chain: Optional[bool] = None) -> bool:
         """Check pet out of hotel."""
         logger.info("[TOOL] Checking pet out of hotel")
-        record = (
-            self._onchain_recording_enabled
-            if record_on_chain is None
-            else bool(record_on_chain)
-        )
-        success, response = await self._send_and_wait(
-            "HOTEL_CHECK_OUT", {}, timeout=10, verify=record
-        )
-        if success:
-            verification = self._extract_verification(response)
-            if verification and record:
-                self._schedule_verified_record_action("HOTEL_CHECK_OUT", verification)
-        return bool(success)
+        return await self._do_simple_action("HOTEL_CHECK_OUT", record_on_chain)
 
     async def buy_hotel(self, tier: str) -> bool:
         """Buy hotel tier."""
-        if not tier or not tier.strip():
+        tier = (tier or "").strip()
+        if not tier:
             logger.error("Invalid hotel tier provided")
             return False
 
         success, response = await self._send_and_wait(
-            "HOTEL_BUY", {"params": {"tier": tier.strip()}}, timeout=10
+            "HOTEL_BUY", {"params": {"tier": tier}}, timeout=10
         )
         if success:
             verification = self._extract_verification(response)
@@ -2204,9 +2495,8 @@ class PettWebSocketClient:
         return bool(success)
 
     async def get_office(self) -> bool:
-        """Get office information."""
-        success, _ = await self._send_and_wait("OFFICE_GET", {}, timeout=10)
-        return bool(success)
+        """Request office information without waiting for the server's reply."""
+        return await self._send_message({"type": "OFFICE_GET", "data": _EMPTY_DATA})
 
     def get_pet_data(self) -> Optional[Dict[str, Any]]:
         """Get current pet data."""
@@ -2237,9 +2527,18 @@ class PettWebSocketClient:
             raw_balance = self.pet_data.get("PetTokens", {}).get(
                 "tokens", self.pet_data.get("balance", "0")
             )
-            return format_wei_to_eth(raw_balance)
+            return self._format_balance(raw_balance)
         return None
 
+    def _format_balance(self, raw_balance: Any) -> str:
+        """Format ``raw_balance``, reusing the last result for the same object."""
+        cached_raw, cached = self._balance_cache
+        if raw_balance is cached_raw:
+            return cached
+        formatted = format_wei_to_eth(raw_balance)
+        self._balance_cache = (raw_balance, formatted)
+        return formatted
+
     def get_pet_hotel_tier(self) -> int:
         """Get current pet hotel tier."""
         if self.pet_data:
@@ -2271,23 +2570,27 @@ class PettWebSocketClient:
         stats = self.get_pet_stats()
         return stats.get("hygiene", 0) if stats else 0
 
+    def _snapshot_stats(self) -> Dict[str, int]:
+        """Return the five tracked pet stats in one pass (0 when unknown)."""
+        pet_data = self.pet_data
+        stats = (pet_data.get("PetStats") if pet_data else None) or _EMPTY
+        return {key: stats.get(key, 0) for key in _PET_STAT_KEYS}
+
     def get_pet_status_summary(self) -> Dict[str, Any]:
         """Get a summary of current pet status."""
-        if not self.pet_data:
+        pet_data = self.pet_data
+        if not pet_data:
             return {}
 
+        raw_balance = (pet_data.get("PetTokens") or _EMPTY).get(
+            "tokens", pet_data.get("balance", "0")
+        )
         return {
-            "name": self.get_pet_name(),
-            "id": self.get_pet_id(),
-            "balance": self.get_pet_balance(),
-            "hotel_tier": self.get_pet_hotel_tier(),
-            "stats": {
-                "hunger": self.get_pet_hunger(),
-                "health": self.get_pet_health(),
-                "energy": self.get_pet_energy(),
-                "happiness": self.get_pet_happiness(),
-                "hygiene": self.get_pet_hygiene(),
-            },
+            "name": pet_data.get("name"),
+            "id": pet_data.get("id"),
+            "balance": self._format_balance(raw_balance),
+            "hotel_tier": pet_data.get("currentHotelTier", 0),
+            "stats": self._snapshot_stats(),
         }
 
     def get_last_action_error(self) -> Optional[str]:
@@ -2314,31 +2617,20 @@ class PettWebSocketClient:
         """Check if JWT token has expired."""
         return self._jwt_expired
 
-    def get_token_refresh_instructions(self) -> str:
-        """Get instructions for refreshing the JWT token."""
-        return """
-🔑 JWT Token Refresh Instructions:
-
-1. **For Privy Authentication:**
-   - Go to your Privy dashboard or authentication flow
-   - Generate a new access token
-   - Update your PRIVY_TOKEN environment variable
-
-2. **For Session Authentication (Recommended):**
-   - Set PETT_SESSION_TOKEN to your session token (e.g. psess_...)
-   - Request a new session token from your backend if it was revoked or expired
+    async def _ready(self) -> bool:
+        """Return True when a request can be sent, reconnecting a dropped socket first.
 
-3. **Common Token Sources:**
-   - Privy Dashboard -> Access Tokens
-   - Your authentication provider's token endpoint
-   - Mobile app authentication flow
-
-4. **Environment Variable:**
-   - Update PRIVY_TOKEN in your .env file
-   - Restart the agent after updating the token
+        Only an expired JWT (or a missing token) fails fast; a plain disconnect
+        gets the same reconnect attempt ``_send_message`` makes for other tools.
+        """
+        if self._jwt_expired:
+            return False
+        if self.connection_established:
+            return True
+        if not self._has_any_auth_token():
+            return False
+        return await self._ensure_connected()
 
-5. **Token Format:**
-   - Ensure the token is valid and not expired
-   - Remove any "Bearer " prefix if present
-   - The token should be the raw JWT string
-"""
+    def get_token_refresh_instructions(self) -> str:
+        """Get instructions for refreshing the JWT token."""
+        return _JWT_REFRESH_INSTRUCTIONS
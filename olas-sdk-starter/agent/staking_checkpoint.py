@@ -9,26 +9,53 @@ elapsed since the last checkpoint execution.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import itertools
 import json
 import logging
 import os
+import random
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, Iterator, Optional, Tuple, cast
 
 from eth_account.signers.local import LocalAccount
+from hexbytes import HexBytes
 from web3 import Web3
 from web3.contract import Contract
-from web3.exceptions import ContractLogicError
-from web3.middleware import ExtraDataToPOAMiddleware
+from web3.exceptions import (
+    BadFunctionCallOutput,
+    ContractLogicError,
+    Web3RPCError,
+)
 from web3.types import TxParams
 
+from .eth_client import checksum_address, get_web3
 from .gas_limits import MAX_TRANSACTION_GAS
 from .nonce_utils import get_shared_nonce_lock
 
+try:
+    import orjson
+
+    def _dump_state(payload: Dict[str, Any]) -> bytes:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+
+    _load_state_bytes = orjson.loads
+
+except ImportError:
+    # Fallback to the stdlib codec when orjson is not installed
+
+    def _dump_state(payload: Dict[str, Any]) -> bytes:
+        return json.dumps(payload, indent=2, sort_keys=True).encode("utf-8")
+
+    _load_state_bytes = json.loads
+
+
 DEFAULT_SAFE_ADDRESS = "0xdf5bae4216Dc278313712291c91D2DeAF2Cc9c1c"
 DEFAULT_STATE_FILE = Path("data/staking_checkpoint_state.json")
 DEFAULT_LIVENESS_PERIOD = 86_400  # 24 hours
@@ -40,7 +67,21 @@ MIN_PRIORITY_FEE_PER_GAS = Web3.to_wei(1, "mwei")  # 0.001 gwei floor
 MAX_PRIORITY_FEE_PER_GAS = Web3.to_wei(50, "mwei")  # 0.05 gwei cap
 MIN_FEE_BUFFER_PER_GAS = Web3.to_wei(5, "mwei")  # 0.005 gwei headroom
 MAX_FEE_BUFFER_PER_GAS = Web3.to_wei(50, "mwei")  # 0.05 gwei cap
+_PRIORITY_FEE_BOUNDS = (int(MIN_PRIORITY_FEE_PER_GAS), int(MAX_PRIORITY_FEE_PER_GAS))
+_FEE_BUFFER_BOUNDS = (int(MIN_FEE_BUFFER_PER_GAS), int(MAX_FEE_BUFFER_PER_GAS))
 PRIORITY_FEE_OVERRIDE_ENV = "CHECKPOINT_PRIORITY_FEE_WEI"
+# Fixed gas limit for checkpoint(); when set, eth_estimateGas is skipped.
+GAS_LIMIT_OVERRIDE_ENV = "CHECKPOINT_GAS_LIMIT"
+LATEST_BLOCK_CACHE_TTL_SECONDS = 2.0  # roughly one block on Base
+PRIORITY_FEE_CACHE_TTL_SECONDS = 60.0
+# Tip suggestion: median of the 25th-percentile reward over recent blocks
+FEE_HISTORY_BLOCKS = 5
+FEE_HISTORY_PERCENTILE = 25
+GAS_ESTIMATE_CACHE_TTL_SECONDS = 3_600.0  # checkpoint() gas usage is stable
+# The nonce is counted locally; the pending count is only re-read after this
+# many "nonce too low" strikes, or once the last sync is this old.
+NONCE_RESYNC_STRIKES = 3
+NONCE_RESYNC_INTERVAL_SECONDS = 5.0
 
 # Minimal ABI fragment for the staking proxy contract.
 STAKING_PROXY_ABI: list[Dict[str, Any]] = [
@@ -74,8 +115,74 @@ STAKING_PROXY_ABI: list[Dict[str, Any]] = [
     },
 ]
 
+# Multicall3 is deployed at the same address on every supported chain.
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI: list[Dict[str, Any]] = [
+    {
+        "inputs": [
+            {"internalType": "bool", "name": "requireSuccess", "type": "bool"},
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call[]",
+                "name": "calls",
+                "type": "tuple[]",
+            },
+        ],
+        "name": "tryAggregate",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "getCurrentBlockTimestamp",
+        "outputs": [
+            {"internalType": "uint256", "name": "timestamp", "type": "uint256"}
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+
+# JSON-RPC codes clients use when rejecting a submitted transaction (Geth and
+# Erigon use -32000, Nethermind and some gateways -32003/-32010).
+_TX_REJECTED_CODES = frozenset({-32000, -32003, -32010})
+# Rejection messages meaning another transaction already holds the nonce.
+_NONCE_TAKEN_TOKENS = frozenset(
+    {"nonce too low", "oldnonce", "replacement transaction underpriced"}
+)
+
+
+def _rpc_error_details(error: Exception) -> Tuple[Optional[int], str]:
+    """Return the JSON-RPC error code and message carried by a provider error."""
+    payload: Any = None
+    if isinstance(error, Web3RPCError):
+        payload = (error.rpc_response or {}).get("error")
+    elif error.args:
+        payload = error.args[0]
+    if isinstance(payload, dict):
+        code = payload.get("code")
+        return (code if isinstance(code, int) else None), str(
+            payload.get("message", "")
+        )
+    return None, str(error)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class CheckpointConfig:
     """Configuration required to interact with the staking contract."""
 
@@ -93,6 +200,45 @@ class CheckpointConfig:
 class StakingCheckpointClient:
     """Encapsulates the staking checkpoint interaction logic."""
 
+    # Fixed attribute layout: no per-instance __dict__, cheaper attribute access
+    __slots__ = (
+        "_logger",
+        "_config",
+        "_w3",
+        "_staking_contract",
+        "_multicall_contract",
+        "_account",
+        "_private_key",
+        "_safe_address",
+        "_state_file",
+        "_cached_liveness_period",
+        "_warned_missing_liveness",
+        "_nonce_lock",
+        "_nonce_counter",
+        "_nonce_retry_count",
+        "_nonce_synced_at",
+        "_chain_id",
+        "_checkpoint_calldata",
+        "_calldata",
+        "_latest_block_cache",
+        "_priority_fee_cache",
+        "_static_gas_limit",
+        "_gas_cache",
+        "_call_lock",
+        "_async_call_lock",
+        "_last_known_checkpoint_ts",
+        "_last_checked_at",
+        "_last_submitted_at",
+        "_last_tx_hash",
+        "_next_due_ts",
+        "_dry_run",
+        "_kpi_disabled_logged",
+        "_pending_state",
+        "_defer_state_writes",
+        "_last_persisted_key",
+        "_executor",
+    )
+
     def __init__(
         self,
         config: CheckpointConfig,
@@ -102,6 +248,7 @@ class StakingCheckpointClient:
         self._config = config
         self._w3: Optional[Web3] = None
         self._staking_contract: Optional[Contract] = None
+        self._multicall_contract: Optional[Contract] = None
         self._account: Optional[LocalAccount] = None
         self._private_key: Optional[str] = None
         self._safe_address = self._normalise_address(config.safe_address)
@@ -109,14 +256,35 @@ class StakingCheckpointClient:
         self._cached_liveness_period: Optional[int] = config.liveness_period
         self._warned_missing_liveness = False
         self._nonce_lock = threading.Lock()
-        self._nonce_cache: Optional[int] = None
+        self._nonce_counter: Optional[Iterator[int]] = None
+        self._nonce_retry_count = 0
+        self._nonce_synced_at = 0.0
+        self._chain_id: Optional[int] = None
+        self._checkpoint_calldata: Optional[str] = None
+        self._calldata: Dict[str, str] = {}
+        self._latest_block_cache: Optional[Tuple[Any, float]] = None
+        self._priority_fee_cache: Optional[Tuple[int, float]] = None
+        self._static_gas_limit = self._read_gas_limit_override()
+        self._gas_cache: Optional[Tuple[int, float]] = None
         self._call_lock = threading.Lock()
+        self._async_call_lock: Optional[asyncio.Lock] = None
         self._last_known_checkpoint_ts: Optional[int] = None
         self._last_checked_at: Optional[int] = None
         self._last_submitted_at: Optional[int] = None
         self._last_tx_hash: Optional[str] = None
+        self._next_due_ts: Optional[int] = None
         self._dry_run: bool = bool(config.dry_run)
         self._kpi_disabled_logged = False
+        self._pending_state: Optional[Dict[str, Any]] = None
+        self._defer_state_writes = False
+        self._last_persisted_key: Optional[Tuple[Any, ...]] = None
+        # Dedicated workers so blocking RPC calls never queue behind (or starve)
+        # other users of the loop's default executor. A checkpoint cycle can
+        # hold one worker through its retry backoff, so the second keeps
+        # epoch-end reads from waiting on it; _call_lock still serialises cycles.
+        self._executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="staking-checkpoint"
+        )
 
         self._load_state()
         self._initialise()
@@ -139,20 +307,37 @@ class StakingCheckpointClient:
             )
             return None
 
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            None, self._call_checkpoint_if_needed_sync, force
-        )
+        # Pure local arithmetic; no need to hop onto the executor at all.
+        if not force and self._checkpoint_clearly_not_due():
+            return None
+
+        # Coroutines racing for a checkpoint are turned away on the loop
+        # itself instead of each occupying the executor just to find
+        # _call_lock taken.
+        if self._async_call_lock is None:
+            self._async_call_lock = asyncio.Lock()
+        if self._async_call_lock.locked():
+            self._logger.info(
+                "Skipping staking checkpoint (force=%s): another call in progress",
+                force,
+            )
+            return None
+
+        async with self._async_call_lock:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, self._call_checkpoint_if_needed_sync, force
+            )
 
     async def get_epoch_kpis(self, force_refresh: bool = False) -> Optional[Any]:
         """Return staking KPI snapshot for the current epoch (always None in checkpoint-only mode)."""
         if not self.is_enabled:
             self._logger.debug("Staking checkpoint client is not enabled")
             return None
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            None, self._get_epoch_kpis_sync, force_refresh
-        )
+        # KPIs are disabled in checkpoint-only mode and the sync path does no
+        # I/O, so answer inline rather than queueing behind checkpoint work on
+        # the executor.
+        return self._get_epoch_kpis_sync(force_refresh)
 
     async def get_next_epoch_end_timestamp(self) -> Optional[int]:
         """Return the timestamp when the current staking epoch ends."""
@@ -160,7 +345,7 @@ class StakingCheckpointClient:
             return None
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            None, self._get_next_reward_checkpoint_timestamp
+            self._executor, self._get_next_reward_checkpoint_timestamp
         )
 
     def _call_checkpoint_if_needed_sync(self, force: bool = False) -> Optional[str]:
@@ -168,6 +353,9 @@ class StakingCheckpointClient:
         if not self.is_enabled:
             return None
 
+        if not force and self._checkpoint_clearly_not_due():
+            return None
+
         if not self._call_lock.acquire(blocking=False):
             self._logger.info(
                 "Skipping staking checkpoint (force=%s): another call in progress",
@@ -176,64 +364,80 @@ class StakingCheckpointClient:
             return None
 
         try:
-            assert self._staking_contract is not None
-            assert self._w3 is not None
+            with self._deferred_state_write():
+                return self._run_checkpoint_cycle(force)
+        finally:
+            self._call_lock.release()
 
-            last_onchain = self._get_last_checkpoint_on_chain()
-            current_ts = self._get_current_block_timestamp()
-            liveness = self._get_liveness_period()
-            next_epoch_end = self._get_next_reward_checkpoint_timestamp()
-            should_execute = force
-            skip_reason: Optional[str] = None
-
-            if not should_execute:
-                if self._recent_submission_in_progress(current_ts):
-                    skip_reason = "recent submission still pending"
-                elif liveness is None:
-                    should_execute = True
-                else:
-                    elapsed = current_ts - last_onchain
-                    should_execute = elapsed > liveness
-                    if not should_execute:
-                        remaining = max(liveness - elapsed, 0)
-                        skip_reason = (
-                            f"liveness period not reached yet (remaining {remaining}s)"
-                        )
+    def _checkpoint_clearly_not_due(self) -> bool:
+        """
+        Return True when the cached tsCheckpoint + livenessPeriod proves no
+        checkpoint can be due yet, so the RPC round-trips can be skipped until
+        we are within the cooldown window of that point.
+        """
+        next_due = self._next_due_ts
+        if next_due is None or time.time() >= next_due - SUBMISSION_COOLDOWN_SECONDS:
+            return False
+        self._logger.debug("Skipping staking checkpoint: next due at %s", next_due)
+        return True
 
-            if (
-                should_execute
-                and next_epoch_end is not None
-                and current_ts < next_epoch_end
-            ):
-                remaining = max(next_epoch_end - current_ts, 0)
-                eta = datetime.fromtimestamp(next_epoch_end).isoformat()
-                skip_reason = (
-                    f"epoch end not reached yet (remaining {remaining}s, ETA {eta})"
-                )
-                should_execute = False
+    def _run_checkpoint_cycle(self, force: bool) -> Optional[str]:
+        """Decide whether a checkpoint is due and submit it when it is."""
+        assert self._staking_contract is not None
+        assert self._w3 is not None
 
-            self._record_state(last_onchain, current_ts, self._last_tx_hash)
+        last_onchain, current_ts = self._read_checkpoint_inputs()
+        liveness = self._get_liveness_period()
+        next_epoch_end = self._get_next_reward_checkpoint_timestamp()
+        should_execute = force
+        skip_reason: Optional[str] = None
+
+        if not should_execute:
+            if self._recent_submission_in_progress(current_ts):
+                skip_reason = "recent submission still pending"
+            elif liveness is None:
+                should_execute = True
+            else:
+                elapsed = current_ts - last_onchain
+                should_execute = elapsed > liveness
+                if not should_execute:
+                    remaining = max(liveness - elapsed, 0)
+                    skip_reason = (
+                        f"liveness period not reached yet (remaining {remaining}s)"
+                    )
 
-            if not should_execute:
-                reason = skip_reason or "execution conditions not met"
-                self._logger.info(
-                    "Skipping staking checkpoint (force=%s): %s", force, reason
-                )
-                return None
+        if (
+            should_execute
+            and next_epoch_end is not None
+            and current_ts < next_epoch_end
+        ):
+            remaining = max(next_epoch_end - current_ts, 0)
+            eta = datetime.fromtimestamp(next_epoch_end).isoformat()
+            skip_reason = (
+                f"epoch end not reached yet (remaining {remaining}s, ETA {eta})"
+            )
+            should_execute = False
 
-            tx_hash = self._submit_checkpoint_transaction(current_ts)
-            if tx_hash:
-                self._logger.info(
-                    "Staking checkpoint transaction submitted (force=%s): %s",
-                    force,
-                    tx_hash,
-                )
-                self._record_state(
-                    last_onchain, current_ts, tx_hash, submission_ts=current_ts
-                )
-            return tx_hash
-        finally:
-            self._call_lock.release()
+        self._record_state(last_onchain, current_ts, self._last_tx_hash)
+
+        if not should_execute:
+            reason = skip_reason or "execution conditions not met"
+            self._logger.info(
+                "Skipping staking checkpoint (force=%s): %s", force, reason
+            )
+            return None
+
+        tx_hash = self._submit_checkpoint_transaction(current_ts)
+        if tx_hash:
+            self._logger.info(
+                "Staking checkpoint transaction submitted (force=%s): %s",
+                force,
+                tx_hash,
+            )
+            self._record_state(
+                last_onchain, current_ts, tx_hash, submission_ts=current_ts
+            )
+        return tx_hash
 
     def _get_epoch_kpis_sync(self, force_refresh: bool = False) -> Optional[Any]:
         """Blocking implementation of KPI retrieval (disabled in checkpoint-only mode)."""
@@ -258,6 +462,116 @@ class StakingCheckpointClient:
             cooldown = min(SUBMISSION_COOLDOWN_SECONDS, max(liveness // 2, 30))
         return (current_ts - self._last_submitted_at) < cooldown
 
+    def _read_checkpoint_inputs(self) -> tuple[int, int]:
+        """
+        Return (last checkpoint timestamp, latest block timestamp).
+
+        tsCheckpoint, the block timestamp and - until cached - livenessPeriod
+        are read in a single Multicall3 eth_call, or in a single JSON-RPC batch
+        on chains without Multicall3. Any leg that fails falls back to its
+        individual RPC helper.
+        """
+        assert self._staking_contract is not None
+
+        contract = self._staking_contract
+        include_liveness = self._cached_liveness_period is None
+        values: list[Optional[int]] = []
+        if self._multicall_contract is not None:
+            calls = [
+                (contract.address, self._calldata["tsCheckpoint"]),
+                (MULTICALL3_ADDRESS, self._calldata["getCurrentBlockTimestamp"]),
+            ]
+            if include_liveness:
+                calls.append((contract.address, self._calldata["livenessPeriod"]))
+            values = [self._decode_uint(data) for data in self._multicall(calls)]
+        if all(value is None for value in values):
+            values = self._batch_checkpoint_reads(include_liveness)
+
+        last_onchain = values[0]
+        if last_onchain is None:
+            last_onchain = self._get_last_checkpoint_on_chain()
+        else:
+            self._last_known_checkpoint_ts = last_onchain
+
+        current_ts = values[1]
+        if current_ts is None:
+            current_ts = self._get_current_block_timestamp()
+
+        if include_liveness and len(values) > 2 and values[2]:
+            self._cached_liveness_period = values[2]
+
+        liveness = self._get_liveness_period() or DEFAULT_LIVENESS_PERIOD
+        self._next_due_ts = last_onchain + liveness
+
+        return last_onchain, current_ts
+
+    def _batch_checkpoint_reads(self, include_liveness: bool) -> list[Optional[int]]:
+        """
+        Read tsCheckpoint, the latest block and optionally livenessPeriod in
+        one JSON-RPC batch. Entries are None when the batch fails.
+        """
+        assert self._w3 is not None
+        assert self._staking_contract is not None
+        w3 = self._w3
+        functions = self._staking_contract.functions
+
+        values: list[Optional[int]] = [None, None, None]
+        try:
+            with w3.batch_requests() as batch:
+                batch.add(functions.tsCheckpoint())
+                batch.add(w3.eth.get_block("latest", full_transactions=False))
+                if include_liveness:
+                    batch.add(functions.livenessPeriod())
+                results = batch.execute()
+        except Exception as exc:
+            self._logger.debug(
+                "Batched checkpoint reads failed; using single calls: %s", exc
+            )
+            return values
+
+        block = results[1]
+        self._latest_block_cache = (block, time.monotonic())
+        timestamp = block.get("timestamp")
+        values[0] = int(results[0] or 0)
+        values[1] = int(timestamp) if timestamp is not None else None
+        if include_liveness:
+            values[2] = int(results[2] or 0)
+        return values
+
+    def _multicall(self, calls: list[tuple[str, str]]) -> list[Optional[bytes]]:
+        """
+        Execute read-only calls through Multicall3.tryAggregate.
+
+        Returns the raw return data per call, or None for calls that reverted.
+        When the aggregate call itself fails every entry is None.
+        """
+        if self._multicall_contract is None:
+            return [None] * len(calls)
+        try:
+            results = self._multicall_contract.functions.tryAggregate(
+                False, [(target, HexBytes(data)) for target, data in calls]
+            ).call()
+        except BadFunctionCallOutput:
+            # No Multicall3 deployment on this chain; stop trying.
+            self._logger.info(
+                "Multicall3 unavailable on this chain; using batched RPC reads"
+            )
+            self._multicall_contract = None
+            return [None] * len(calls)
+        except Exception as exc:
+            self._logger.debug("Multicall3 batch failed; using single calls: %s", exc)
+            return [None] * len(calls)
+        return [bytes(data) if success else None for success, data in results]
+
+    def _decode_uint(self, data: Optional[bytes]) -> Optional[int]:
+        """Decode a single uint256 return value, None when unavailable."""
+        if not data or self._w3 is None:
+            return None
+        try:
+            return int(self._w3.codec.decode(["uint256"], data)[0])
+        except Exception:
+            return None
+
     def _get_last_checkpoint_on_chain(self) -> int:
         """Fetch the last checkpoint timestamp from the contract."""
         assert self._staking_contract is not None
@@ -277,7 +591,7 @@ class StakingCheckpointClient:
         """Return the timestamp of the latest block."""
         assert self._w3 is not None
         try:
-            latest_block = self._w3.eth.get_block("latest")
+            latest_block = self._fetch_latest_block_header()
             timestamp = latest_block.get("timestamp")
             if timestamp is None:
                 raise KeyError("timestamp")
@@ -355,21 +669,45 @@ class StakingCheckpointClient:
 
         max_attempts = 3
         method_label = "checkpoint"
+        # Dry runs never broadcast, so they do not need to serialise with
+        # other senders of this address.
+        submit_lock = contextlib.nullcontext() if self._dry_run else self._nonce_lock
         for attempt in range(max_attempts):
-            try:
-                with self._nonce_lock:
+            if attempt:
+                # Back off outside the nonce lock so other senders of this
+                # address are not held up while we wait.
+                time.sleep(0.25 * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+            with submit_lock:
+                nonce: Optional[int] = None
+                try:
+                    prefetched = self._prefetch_submission_inputs()
+                    if "nonce" in prefetched:
+                        self._sync_nonce(int(prefetched["nonce"]))
+                    if "chain_id" in prefetched:
+                        self._chain_id = int(prefetched["chain_id"])
+
                     nonce = self._resolve_nonce()
                     tx_params: Dict[str, Any] = {
-                        "from": self._account.address,
+                        **self._checkpoint_call_params(),
                         "nonce": nonce,
+                        "value": 0,
                     }
 
-                    gas_limit = self._estimate_gas(tx_params)
-                    if gas_limit:
-                        tx_params["gas"] = gas_limit
-
-                    self._apply_fee_parameters(tx_params)
-                    tx_params["chainId"] = w3.eth.chain_id
+                    gas_limit = self._static_gas_limit or self._estimate_gas(
+                        tx_params, prefetched.get("gas")
+                    )
+                    if not gas_limit:
+                        # Let the node surface the revert reason, as
+                        # build_transaction would when estimating on its own.
+                        gas_limit = w3.eth.estimate_gas(cast(TxParams, tx_params))
+                    tx_params["gas"] = gas_limit
+
+                    self._apply_fee_parameters(
+                        tx_params,
+                        prefetched.get("block"),
+                        prefetched.get("priority_fee"),
+                    )
+                    tx_params["chainId"] = self._get_chain_id()
 
                     self._logger.info(
                         "Submitting staking %s transaction via safe %s "
@@ -380,8 +718,7 @@ class StakingCheckpointClient:
                         current_ts,
                     )
 
-                    checkpoint_fn = self._get_checkpoint_function()
-                    txn = checkpoint_fn.build_transaction(cast(TxParams, tx_params))
+                    txn = tx_params
 
                     if self._dry_run:
                         # Do not sign/send; just print what would be submitted
@@ -404,6 +741,8 @@ class StakingCheckpointClient:
                             )
                         except Exception:
                             pass
+                        # Nothing was broadcast; hand the nonce back.
+                        self._release_nonce(nonce)
                         return None
                     signed = w3.eth.account.sign_transaction(
                         txn, private_key=self._private_key
@@ -416,41 +755,169 @@ class StakingCheckpointClient:
                             "Signed transaction missing raw payload for checkpoint call"
                         )
                     tx_hash = w3.eth.send_raw_transaction(raw_tx)
-                    self._nonce_cache = nonce + 1
                     self._last_submitted_at = current_ts
                     self._last_tx_hash = tx_hash.hex()
+                    self._nonce_retry_count = 0
                     return self._last_tx_hash
-            except ValueError as exc:
-                self._handle_value_error(exc)
-                lowered = str(exc).lower()
-                if "nonce too low" in lowered and attempt < max_attempts - 1:
-                    time.sleep(0.25)
-                    continue
-                raise
-            except ContractLogicError as exc:
-                self._logger.warning(
-                    "Staking contract rejected checkpoint transaction: %s", exc
-                )
-                self._nonce_cache = None
-                return None
-            except Exception:
-                self._nonce_cache = None
-                raise
+                except (ValueError, Web3RPCError) as exc:
+                    nonce_taken = self._handle_value_error(exc, nonce)
+                    if nonce_taken and self._previous_submission_pending():
+                        # Our last checkpoint still holds the nonce; re-signing
+                        # would only trigger replacement-underpriced loops.
+                        self._logger.info(
+                            "Previous staking checkpoint transaction %s still "
+                            "pending; not resubmitting",
+                            self._last_tx_hash,
+                        )
+                        return None
+                    if nonce_taken and attempt < max_attempts - 1:
+                        continue
+                    raise
+                except ContractLogicError as exc:
+                    self._logger.warning(
+                        "Staking contract rejected checkpoint transaction: %s", exc
+                    )
+                    self._release_nonce(nonce)
+                    self._gas_cache = None
+                    return None
+                except Exception:
+                    self._nonce_counter = None
+                    raise
 
         return None
 
-    def _get_checkpoint_function(self) -> Any:
-        """Return the contract function to invoke for the next checkpoint."""
+    def _previous_submission_pending(self) -> bool:
+        """Return True if the last checkpoint transaction is still in the mempool."""
+        if not self._last_tx_hash or self._w3 is None:
+            return False
+        try:
+            tx = self._w3.eth.get_transaction(HexBytes(self._last_tx_hash))
+        except Exception as exc:
+            # Unknown to the node (dropped or never propagated) or lookup failed
+            self._logger.debug(
+                "Could not look up previous checkpoint transaction %s: %s",
+                self._last_tx_hash,
+                exc,
+            )
+            return False
+        return tx.get("blockNumber") is None
+
+    def _prefetch_submission_inputs(self) -> Dict[str, Any]:
+        """
+        Fetch the independent submission reads in a single JSON-RPC batch.
+
+        Returns a mapping with any of "nonce", "chain_id", "block",
+        "priority_fee" (derived from eth_feeHistory) and "gas". Values already
+        cached are not requested, and an empty mapping is returned when the
+        batch fails so the caller falls back to the individual RPC helpers.
+        """
+        assert self._w3 is not None
+        assert self._account is not None
+        w3 = self._w3
+        address = self._account.address
+
+        cached_block = self._cached_latest_block()
+        keys: list[str] = []
+        try:
+            with w3.batch_requests() as batch:
+                if self._nonce_counter is None:
+                    batch.add(w3.eth.get_transaction_count(address, "pending"))
+                    keys.append("nonce")
+                if self._chain_id is None:
+                    batch.add(w3.eth.chain_id)
+                    keys.append("chain_id")
+                if cached_block is None:
+                    batch.add(w3.eth.get_block("latest", full_transactions=False))
+                    keys.append("block")
+                if (
+                    not os.environ.get(PRIORITY_FEE_OVERRIDE_ENV)
+                    and self._cached_priority_fee() is None
+                ):
+                    batch.add(
+                        w3.eth.fee_history(
+                            FEE_HISTORY_BLOCKS, "latest", [FEE_HISTORY_PERCENTILE]
+                        )
+                    )
+                    keys.append("fee_history")
+                if (
+                    self._static_gas_limit is None
+                    and self._cached_gas_estimate() is None
+                ):
+                    batch.add(
+                        w3.eth.estimate_gas(
+                            cast(TxParams, self._checkpoint_call_params())
+                        )
+                    )
+                    keys.append("gas")
+                results = batch.execute()
+        except Exception as exc:
+            self._logger.debug(
+                "Batched checkpoint submission reads failed; using single calls: %s",
+                exc,
+            )
+            return {}
+
+        prefetched = dict(zip(keys, results))
+        if "fee_history" in prefetched:
+            prefetched["priority_fee"] = self._priority_fee_from_history(
+                prefetched.pop("fee_history")
+            )
+        if "block" in prefetched:
+            self._latest_block_cache = (prefetched["block"], time.monotonic())
+        elif cached_block is not None:
+            prefetched["block"] = cached_block
+        return prefetched
+
+    def _cached_latest_block(self) -> Optional[Any]:
+        """Return the latest block header if fetched within the cache TTL."""
+        cached = self._latest_block_cache
+        if cached is None:
+            return None
+        block, fetched_at = cached
+        if time.monotonic() - fetched_at >= LATEST_BLOCK_CACHE_TTL_SECONDS:
+            return None
+        return block
+
+    def _fetch_latest_block_header(self) -> Any:
+        """Return the latest block header (without transactions), shared briefly."""
+        block = self._cached_latest_block()
+        if block is None:
+            assert self._w3 is not None
+            block = self._w3.eth.get_block("latest", full_transactions=False)
+            self._latest_block_cache = (block, time.monotonic())
+        return block
+
+    def _get_chain_id(self) -> int:
+        """Return the chain id, fetching it once per client lifetime."""
+        if self._chain_id is None:
+            assert self._w3 is not None
+            self._chain_id = int(self._w3.eth.chain_id)
+        return self._chain_id
+
+    def _checkpoint_call_params(self) -> Dict[str, Any]:
+        """Return the from/to/data fields of the checkpoint call."""
         assert self._staking_contract is not None
-        return self._staking_contract.functions.checkpoint()
+        assert self._account is not None
+        return {
+            "from": self._account.address,
+            "to": self._staking_contract.address,
+            "data": self._checkpoint_calldata,
+        }
 
-    def _estimate_gas(self, tx_params: Dict[str, Any]) -> Optional[int]:
+    def _estimate_gas(
+        self, tx_params: Dict[str, Any], gas_estimate: Optional[int] = None
+    ) -> Optional[int]:
         """Estimate gas usage for the checkpoint transaction."""
         if self._staking_contract is None:
             return None
         try:
-            checkpoint_fn = self._get_checkpoint_function()
-            gas_estimate = checkpoint_fn.estimate_gas(cast(TxParams, tx_params))
+            if gas_estimate is None:
+                gas_estimate = self._cached_gas_estimate()
+            if gas_estimate is None:
+                assert self._w3 is not None
+                gas_estimate = self._w3.eth.estimate_gas(cast(TxParams, tx_params))
+            if self._gas_cache is None:
+                self._gas_cache = (int(gas_estimate), time.monotonic())
             buffered = int(gas_estimate * 1.2)
             result = max(buffered, 200_000)
             if result > MAX_TRANSACTION_GAS:
@@ -465,19 +932,52 @@ class StakingCheckpointClient:
             self._logger.debug("Gas estimation failed for staking checkpoint: %s", exc)
             return None
 
-    def _apply_fee_parameters(self, tx_params: Dict[str, Any]) -> None:
+    def _cached_gas_estimate(self) -> Optional[int]:
+        """Return the cached raw checkpoint() gas estimate while it is fresh."""
+        cached = self._gas_cache
+        if cached is None:
+            return None
+        gas_estimate, estimated_at = cached
+        if time.monotonic() - estimated_at >= GAS_ESTIMATE_CACHE_TTL_SECONDS:
+            self._gas_cache = None
+            return None
+        return gas_estimate
+
+    def _read_gas_limit_override(self) -> Optional[int]:
+        """Return the fixed checkpoint gas limit from the environment, if any."""
+        override_raw = os.environ.get(GAS_LIMIT_OVERRIDE_ENV)
+        if not override_raw:
+            return None
+        try:
+            gas_limit = int(override_raw)
+        except ValueError:
+            self._logger.warning(
+                "Invalid %s value '%s'; ignoring", GAS_LIMIT_OVERRIDE_ENV, override_raw
+            )
+            return None
+        if gas_limit <= 0:
+            return None
+        return min(gas_limit, MAX_TRANSACTION_GAS)
+
+    def _apply_fee_parameters(
+        self,
+        tx_params: Dict[str, Any],
+        latest_block: Optional[Any] = None,
+        priority_suggestion: Optional[int] = None,
+    ) -> None:
         """Populate gas price / fee parameters depending on network support."""
         if self._w3 is None:
             raise RuntimeError("Web3 not initialised for checkpoint client")
 
-        try:
-            latest_block = self._w3.eth.get_block("latest")
-        except Exception as exc:
-            self._logger.debug(
-                "Failed to fetch latest block for fee parameters: %s", exc
-            )
-            tx_params["gasPrice"] = self._w3.eth.gas_price
-            return
+        if latest_block is None:
+            try:
+                latest_block = self._fetch_latest_block_header()
+            except Exception as exc:
+                self._logger.debug(
+                    "Failed to fetch latest block for fee parameters: %s", exc
+                )
+                tx_params["gasPrice"] = self._w3.eth.gas_price
+                return
 
         base_fee = latest_block.get("baseFeePerGas")
         if base_fee is None:
@@ -485,9 +985,8 @@ class StakingCheckpointClient:
             return
 
         base_fee_int = int(base_fee)
-        priority_fee = int(self._suggest_priority_fee())
-        min_buffer = int(MIN_FEE_BUFFER_PER_GAS)
-        max_buffer = int(MAX_FEE_BUFFER_PER_GAS)
+        priority_fee = self._suggest_priority_fee(priority_suggestion)
+        min_buffer, max_buffer = _FEE_BUFFER_BOUNDS
 
         if priority_fee <= 0:
             buffer = min_buffer
@@ -507,10 +1006,10 @@ class StakingCheckpointClient:
             max_fee,
         )
 
-    def _suggest_priority_fee(self) -> int:
+    def _suggest_priority_fee(self, suggested: Optional[int] = None) -> int:
         """Return a conservative priority fee similar to Safe.execTransaction."""
         if self._w3 is None:
-            return int(DEFAULT_PRIORITY_FEE_PER_GAS)
+            return DEFAULT_PRIORITY_FEE_PER_GAS
 
         priority_fee: Optional[int] = None
 
@@ -530,6 +1029,24 @@ class StakingCheckpointClient:
                     override_raw,
                 )
 
+        if priority_fee is None and suggested is not None:
+            priority_fee = int(suggested)
+            self._priority_fee_cache = (priority_fee, time.monotonic())
+
+        if priority_fee is None:
+            priority_fee = self._cached_priority_fee()
+
+        if priority_fee is None:
+            try:
+                history = self._w3.eth.fee_history(
+                    FEE_HISTORY_BLOCKS, "latest", [FEE_HISTORY_PERCENTILE]
+                )
+                priority_fee = self._priority_fee_from_history(history)
+                if priority_fee is not None:
+                    self._priority_fee_cache = (priority_fee, time.monotonic())
+            except Exception as exc:
+                self._logger.debug("eth_feeHistory unavailable for checkpoint: %s", exc)
+
         if priority_fee is None:
             try:
                 suggested = getattr(self._w3.eth, "max_priority_fee", None)
@@ -537,47 +1054,101 @@ class StakingCheckpointClient:
                     suggested = suggested()
                 if suggested is not None:
                     priority_fee = int(suggested)
+                    self._priority_fee_cache = (priority_fee, time.monotonic())
             except Exception as exc:
                 self._logger.debug(
                     "Failed to obtain RPC priority fee suggestion: %s", exc
                 )
 
         if priority_fee is None or priority_fee <= 0:
-            priority_fee = int(DEFAULT_PRIORITY_FEE_PER_GAS)
+            priority_fee = DEFAULT_PRIORITY_FEE_PER_GAS
 
-        if 0 < priority_fee < int(MIN_PRIORITY_FEE_PER_GAS):
-            priority_fee = int(MIN_PRIORITY_FEE_PER_GAS)
-        elif priority_fee > int(MAX_PRIORITY_FEE_PER_GAS):
-            priority_fee = int(MAX_PRIORITY_FEE_PER_GAS)
+        low, high = _PRIORITY_FEE_BOUNDS
+        return min(max(priority_fee, low), high)
 
+    def _priority_fee_from_history(self, history: Any) -> Optional[int]:
+        """Return the median per-block low-percentile tip from eth_feeHistory."""
+        try:
+            rewards = sorted(int(entry[0]) for entry in history["reward"] if entry)
+        except Exception:
+            return None
+        if not rewards:
+            return None
+        return rewards[len(rewards) // 2]
+
+    def _cached_priority_fee(self) -> Optional[int]:
+        """Return the RPC priority fee suggestion if still fresh."""
+        cached = self._priority_fee_cache
+        if cached is None:
+            return None
+        priority_fee, fetched_at = cached
+        if time.monotonic() - fetched_at >= PRIORITY_FEE_CACHE_TTL_SECONDS:
+            return None
         return priority_fee
 
     def _resolve_nonce(self) -> int:
-        """Return the next transaction nonce, caching between submissions."""
+        """Return the next transaction nonce, counting locally between submissions."""
         if self._w3 is None or self._account is None:
             raise RuntimeError(
                 "Nonce requested before checkpoint client initialisation"
             )
-        if self._nonce_cache is None:
-            self._nonce_cache = self._w3.eth.get_transaction_count(
-                self._account.address, "pending"
+        if self._nonce_counter is None:
+            self._sync_nonce(
+                self._w3.eth.get_transaction_count(self._account.address, "pending")
             )
-        return self._nonce_cache
+        assert self._nonce_counter is not None
+        return next(self._nonce_counter)
+
+    def _sync_nonce(self, pending_nonce: int) -> None:
+        """Restart local nonce counting from the node's pending count."""
+        self._nonce_counter = itertools.count(int(pending_nonce))
+        self._nonce_synced_at = time.monotonic()
+        self._nonce_retry_count = 0
+
+    def _release_nonce(self, nonce: Optional[int]) -> None:
+        """Hand back a nonce that was drawn but never broadcast."""
+        if nonce is None:
+            return
+        self._nonce_counter = itertools.count(nonce)
 
-    def _handle_value_error(self, error: ValueError) -> None:
-        """Interpret provider errors to adjust nonce cache when relevant."""
-        message = str(error)
-        lowered = message.lower()
-        if "nonce too low" in lowered:
-            self._logger.debug("RPC reported nonce too low; clearing cached nonce")
-            self._nonce_cache = None
-        elif "replacement transaction underpriced" in lowered:
-            self._logger.debug(
-                "Replacement transaction underpriced; clearing cached nonce"
+    def _handle_value_error(
+        self, error: Exception, nonce: Optional[int] = None
+    ) -> bool:
+        """
+        Interpret provider errors to adjust the local nonce counter.
+
+        Returns True when the node rejected the transaction because its nonce
+        is already taken, in which case retrying with the next nonce may help.
+        """
+        code, message = _rpc_error_details(error)
+        nonce_taken = False
+        if code is None or code in _TX_REJECTED_CODES:
+            lowered = message.lower()
+            nonce_taken = any(token in lowered for token in _NONCE_TAKEN_TOKENS)
+        if nonce_taken:
+            # The slot is taken; the counter has already moved past it, so
+            # only go back to the node when skipping ahead keeps failing.
+            self._nonce_retry_count += 1
+            stale = (
+                time.monotonic() - self._nonce_synced_at
+                >= NONCE_RESYNC_INTERVAL_SECONDS
             )
-            self._nonce_cache = None
+            if self._nonce_retry_count >= NONCE_RESYNC_STRIKES or stale:
+                self._logger.debug(
+                    "RPC rejected nonce %s (%s); resyncing nonce counter",
+                    nonce,
+                    message,
+                )
+                self._nonce_counter = None
+            else:
+                self._logger.debug(
+                    "RPC rejected nonce %s (%s); trying the next one", nonce, message
+                )
         else:
             self._logger.warning("RPC error during checkpoint submission: %s", message)
+            # The transaction was not accepted, so its nonce is still free.
+            self._release_nonce(nonce)
+        return nonce_taken
 
     def _initialise(self) -> None:
         """Initialise web3 provider, account and staking contract."""
@@ -598,19 +1169,22 @@ class StakingCheckpointClient:
             return
 
         try:
-            w3 = Web3(Web3.HTTPProvider(rpc_url))
+            w3 = get_web3(rpc_url)
         except Exception as exc:
             self._logger.error(f"Failed to create Web3 provider for checkpoint: {exc}")
             return
 
-        if not w3.is_connected():
+        # The chain id is needed for signing anyway, so fetching it doubles as
+        # the connectivity check instead of a separate web3_clientVersion call.
+        try:
+            self._chain_id = int(w3.eth.chain_id)
+        except Exception as exc:
             self._logger.warning(
-                "Web3 provider could not connect; staking checkpoint disabled"
+                "Web3 provider could not connect; staking checkpoint disabled: %s",
+                exc,
             )
             return
 
-        self._inject_poa_middleware(w3)
-
         try:
             account = w3.eth.account.from_key(private_key)
         except ValueError as exc:
@@ -619,7 +1193,7 @@ class StakingCheckpointClient:
 
         try:
             staking_contract = w3.eth.contract(
-                address=Web3.to_checksum_address(self._config.staking_contract_address),
+                address=checksum_address(str(self._config.staking_contract_address)),
                 abi=STAKING_PROXY_ABI,
             )
         except Exception as exc:
@@ -628,9 +1202,24 @@ class StakingCheckpointClient:
 
         self._w3 = w3
         self._staking_contract = staking_contract
+        self._multicall_contract = w3.eth.contract(
+            address=checksum_address(MULTICALL3_ADDRESS),
+            abi=MULTICALL3_ABI,
+        )
         self._account = account
         self._private_key = private_key
 
+        # All calls this client makes take no arguments, so their calldata is
+        # static for the lifetime of the contract objects.
+        self._checkpoint_calldata = staking_contract.encode_abi("checkpoint")
+        self._calldata = {
+            "tsCheckpoint": staking_contract.encode_abi("tsCheckpoint"),
+            "livenessPeriod": staking_contract.encode_abi("livenessPeriod"),
+            "getCurrentBlockTimestamp": self._multicall_contract.encode_abi(
+                "getCurrentBlockTimestamp"
+            ),
+        }
+
         # Use a process-wide shared lock for this address to prevent nonce races
         try:
             self._nonce_lock = get_shared_nonce_lock(account.address)
@@ -645,17 +1234,6 @@ class StakingCheckpointClient:
             staking_contract.address,
         )
 
-    def _inject_poa_middleware(self, w3: Web3) -> None:
-        """Inject POA middleware when required (e.g., Base network)."""
-        try:
-            w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
-        except ValueError:
-            pass
-        except Exception as exc:
-            self._logger.debug(
-                f"Failed to inject POA middleware fallback for checkpoint client: {exc}"
-            )
-
     def _record_state(
         self,
         last_checkpoint_ts: int,
@@ -674,7 +1252,7 @@ class StakingCheckpointClient:
         if self._state_file is None:
             return
 
-        payload = {
+        self._pending_state = {
             "last_checkpoint_ts": int(last_checkpoint_ts),
             "last_checked_at": int(checked_at),
             "last_submitted_at": (
@@ -683,12 +1261,56 @@ class StakingCheckpointClient:
                 else None
             ),
             "last_tx_hash": tx_hash,
+            # Only the on-chain value is worth keeping: a configured period is
+            # re-applied on start and the default must not outlive an outage.
+            "liveness_period": (
+                self._cached_liveness_period
+                if self._config.liveness_period is None
+                and not self._warned_missing_liveness
+                else None
+            ),
+            "staking_contract_address": self._config.staking_contract_address,
         }
+        if not self._defer_state_writes:
+            self.flush_state()
+
+    @contextmanager
+    def _deferred_state_write(self) -> Iterator[None]:
+        """Coalesce `_record_state` calls in the block into a single write."""
+        self._defer_state_writes = True
+        try:
+            yield
+        finally:
+            self._defer_state_writes = False
+            self.flush_state()
+
+    def flush_state(self) -> None:
+        """Write any buffered checkpoint state to disk."""
+        payload = self._pending_state
+        if payload is None or self._state_file is None:
+            return
+        self._pending_state = None
+
+        # last_checked_at moves on every poll; only persist it once a minute
+        # unless something that matters on restart has changed.
+        persist_key = (
+            payload["last_checkpoint_ts"],
+            payload["last_checked_at"] // 60,
+            payload["last_submitted_at"],
+            payload["last_tx_hash"],
+            payload["liveness_period"],
+        )
+        if persist_key == self._last_persisted_key:
+            return
 
         try:
             self._state_file.parent.mkdir(parents=True, exist_ok=True)
-            with self._state_file.open("w", encoding="utf-8") as handle:
-                json.dump(payload, handle, indent=2, sort_keys=True)
+            # Write to a sibling temp file and rename so a crash mid-write can
+            # never leave a truncated state file behind.
+            tmp_path = self._state_file.with_name(self._state_file.name + ".tmp")
+            tmp_path.write_bytes(_dump_state(payload))
+            os.replace(tmp_path, self._state_file)
+            self._last_persisted_key = persist_key
         except Exception as exc:
             self._logger.debug(
                 "Failed to persist staking checkpoint state to %s: %s",
@@ -696,15 +1318,19 @@ class StakingCheckpointClient:
                 exc,
             )
 
+    def close(self) -> None:
+        """Persist buffered state and stop the checkpoint worker threads."""
+        self.flush_state()
+        self._executor.shutdown(wait=False)
+
     def _load_state(self) -> None:
         """Load previously persisted state if available."""
         if self._state_file is None:
             return
-        if not self._state_file.exists():
-            return
         try:
-            with self._state_file.open("r", encoding="utf-8") as handle:
-                payload = json.load(handle)
+            payload = _load_state_bytes(self._state_file.read_bytes())
+        except FileNotFoundError:
+            return
         except Exception as exc:
             self._logger.debug(
                 "Failed to load staking checkpoint state from %s: %s",
@@ -731,6 +1357,14 @@ class StakingCheckpointClient:
             )
             tx_hash = payload.get("last_tx_hash")
             self._last_tx_hash = str(tx_hash) if tx_hash else None
+            # livenessPeriod is fixed per staking contract; ignore it if the
+            # agent has since been pointed at a different one.
+            liveness = payload.get("liveness_period")
+            same_contract = str(payload.get("staking_contract_address")).lower() == (
+                str(self._config.staking_contract_address).lower()
+            )
+            if self._cached_liveness_period is None and liveness and same_contract:
+                self._cached_liveness_period = int(liveness)
         except (TypeError, ValueError) as exc:
             self._logger.debug(
                 "Malformed staking checkpoint state payload ignored: %s", exc
@@ -750,6 +1384,6 @@ class StakingCheckpointClient:
         if not addr:
             return DEFAULT_SAFE_ADDRESS
         try:
-            return Web3.to_checksum_address(addr)
+            return checksum_address(addr)
         except Exception:
             return addr
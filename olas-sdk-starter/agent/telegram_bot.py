@@ -179,7 +179,7 @@ class PetTelegramBot:
 
             # Close WebSocket connection
             if self.websocket_client:
-                await self.websocket_client.disconnect()
+                await self.websocket_client.close()
 
 
 async def main():
@@ -9,6 +9,8 @@ from __future__ import annotations
 def main() -> None:
     """Print hidden-import flags for PyInstaller."""
     hidden_imports = [
+        # Project-root runner imported by pyinstaller/agent_runner_entry.py
+        "run",
         "agent.olas_interface",
         "agent.pett_agent",
         "agent.decision_engine",
@@ -21,6 +23,7 @@ def main() -> None:
         "agent.action_recorder",
         "agent.agent_performance",
         "agent.nonce_utils",
+        "agent.eth_client",
         "agent.react_server_manager",
         # pkg_resources vendored dependencies (required when setuptools loads)
         "jaraco",
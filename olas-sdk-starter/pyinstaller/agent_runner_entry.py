@@ -6,12 +6,19 @@ import asyncio
 import sys
 from pathlib import Path
 
-# Ensure the project root is importable when PyInstaller runs the stub. This is necessary because the run.py file is not in the same directory as the pyinstaller/agent_runner_entry.py file.
-PROJ_ROOT = Path(__file__).resolve().parent.parent
-if str(PROJ_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJ_ROOT))
+# Ensure the project root is importable when the stub is run from source. This is necessary because the run.py file is not in the same directory as the pyinstaller/agent_runner_entry.py file.
+# The frozen binary bundles `run` as a hidden import and resolves it from the archive, so it skips the path lookup entirely.
+if not getattr(sys, "frozen", False):
+    PROJ_ROOT = Path(__file__).resolve().parent.parent
+    if str(PROJ_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJ_ROOT))
 
-from run import get_version, main as run_main, parse_args  # noqa: E402
+from run import (  # noqa: E402
+    get_version,
+    install_uvloop,
+    main as run_main,
+    parse_args,
+)
 
 
 def _print_version() -> None:
@@ -26,6 +33,8 @@ def main() -> None:
         _print_version()
         return
 
+    install_uvloop()
+
     try:
         asyncio.run(run_main(password=args.password))
     except KeyboardInterrupt:
@@ -64,6 +64,14 @@ def setup_olas_logging() -> logging.Logger:
         ],
     )
 
+    # None of our formats use thread, process or task fields, so skip
+    # collecting them for every record (see "Optimization" in the logging HOWTO).
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    if sys.version_info >= (3, 12):
+        logging.logAsyncioTasks = False
+
     # Configure specific logger for our agent
     logger = logging.getLogger("pett_agent")
     logger.setLevel(logging.DEBUG)
@@ -133,6 +141,28 @@ def read_ethereum_private_key(password: Optional[str] = None) -> Optional[str]:
         return None
 
 
+def install_uvloop() -> bool:
+    """Use uvloop for the asyncio event loop when it is available."""
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is optional (not available on Windows); keep the default loop
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def enable_eager_tasks() -> bool:
+    """Run new tasks eagerly up to their first suspension point (Python 3.12+)."""
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        return False
+
+    asyncio.get_running_loop().set_task_factory(eager_task_factory)
+    return True
+
+
 def check_withdrawal_mode() -> bool:
     """Check if agent should run in withdrawal mode (Olas SDK requirement)."""
     return False
@@ -140,6 +170,7 @@ def check_withdrawal_mode() -> bool:
 
 async def main(password: Optional[str] = None):
     """Main entry point for the Pett Agent."""
+    enable_eager_tasks()
     logger = setup_olas_logging()
     logger.info("🚀 Starting Pett Agent with Olas SDK compliance")
 
@@ -204,6 +235,8 @@ if __name__ == "__main__":
         print(f"Pett Agent Runner {get_version()}")
         sys.exit(0)
 
+    install_uvloop()
+
     try:
         asyncio.run(main(password=cli_args.password))
     except KeyboardInterrupt:
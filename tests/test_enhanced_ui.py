@@ -4,6 +4,7 @@ Test script for enhanced Pett Agent UI with WebSocket and Pet status
 """
 
 import asyncio
+import contextlib
 import sys
 import os
 from pathlib import Path
@@ -12,12 +13,14 @@ from pathlib import Path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 
-async def test_enhanced_health_check():
+async def test_enhanced_health_check(session=None):
     """Test the enhanced health check endpoint with WebSocket and Pet info."""
     import aiohttp
 
     try:
-        async with aiohttp.ClientSession() as session:
+        async with contextlib.AsyncExitStack() as stack:
+            if session is None:
+                session = await stack.enter_async_context(aiohttp.ClientSession())
             async with session.get("http://localhost:8716/healthcheck") as resp:
                 if resp.status == 200:
                     data = await resp.json()
@@ -53,12 +56,14 @@ async def test_enhanced_health_check():
         return False
 
 
-async def test_enhanced_ui():
+async def test_enhanced_ui(session=None):
     """Test the enhanced agent UI endpoint."""
     import aiohttp
 
     try:
-        async with aiohttp.ClientSession() as session:
+        async with contextlib.AsyncExitStack() as stack:
+            if session is None:
+                session = await stack.enter_async_context(aiohttp.ClientSession())
             async with session.get("http://localhost:8716/") as resp:
                 if resp.status == 200:
                     content = await resp.text()
@@ -90,21 +95,51 @@ async def test_enhanced_ui():
         return False
 
 
+async def _wait_ready(session, deadline: float = 10.0) -> bool:
+    """Poll the health check until the agent server answers or time runs out."""
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    stop_at = loop.time() + deadline
+    attempt = 0
+    while True:
+        try:
+            async with session.get(
+                "http://localhost:8716/healthcheck",
+                timeout=aiohttp.ClientTimeout(total=0.25),
+            ):
+                # Any HTTP answer means the server is up and bound
+                return True
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if loop.time() >= stop_at:
+                return False
+            await asyncio.sleep(min(0.05 * 2**attempt, 0.5))
+            attempt += 1
+
+
 async def main():
     """Run enhanced UI tests."""
     print("🧪 Testing Enhanced Pett Agent UI with WebSocket & Pet Status\n")
 
-    # Wait a moment for agent to start
-    print("⏳ Waiting for agent to start...")
-    await asyncio.sleep(3)
-
-    # Test enhanced health check
-    health_ok = await test_enhanced_health_check()
-    print()
+    import aiohttp
 
-    # Test enhanced UI
-    ui_ok = await test_enhanced_ui()
-    print()
+    # Both probes hit the same agent server; share one connection pool and
+    # run them concurrently since neither depends on the other.
+    async with aiohttp.ClientSession() as session:
+        # Wait for the agent to start, but only as long as it actually takes
+        print("⏳ Waiting for agent to start...")
+        if not await _wait_ready(session):
+            print("⚠️ Agent did not answer within 10s; probing anyway")
+
+        health_ok, ui_ok = (
+            result is True
+            for result in await asyncio.gather(
+                test_enhanced_health_check(session),
+                test_enhanced_ui(session),
+                return_exceptions=True,
+            )
+        )
+        print()
 
     # Summary
     if health_ok and ui_ok:
@@ -0,0 +1,70 @@
+"""
+Unit tests for ActionRecorder initialisation.
+Uses an offline Web3 provider so no RPC endpoint is needed.
+"""
+
+import os
+import sys
+
+import pytest
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+# Add the olas-sdk-starter directory to the path so we can import the agent package
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "..", "olas-sdk-starter")
+)
+
+from agent import action_recorder
+from agent.action_recorder import ActionRecorder, RecorderConfig
+
+PRIVATE_KEY = "0x" + "11" * 32
+SAFE_ADDRESS = "0x" + "22" * 20
+
+
+class OfflineProvider(BaseProvider):
+    """Provider that reports itself connected and only answers eth_chainId."""
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return True
+
+    def make_request(self, method, params):
+        if method == "eth_chainId":
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(100)}
+        raise AssertionError(f"unexpected RPC call: {method}")
+
+
+@pytest.fixture
+def offline_web3(monkeypatch):
+    """Route the recorder's shared Web3 lookup to an offline client."""
+    w3 = Web3(OfflineProvider())
+    monkeypatch.setattr(action_recorder, "get_web3", lambda rpc_url: w3)
+    monkeypatch.setattr(
+        ActionRecorder,
+        "_refresh_safe_owner_status",
+        lambda self, *args, **kwargs: True,
+    )
+    monkeypatch.setenv("CONNECTION_CONFIGS_CONFIG_SAFE_CONTRACT_ADDRESS", SAFE_ADDRESS)
+    return w3
+
+
+def test_recorder_enabled_with_shared_web3(offline_web3):
+    """The recorder initialises against the shared client and is enabled."""
+    recorder = ActionRecorder(
+        RecorderConfig(private_key=PRIVATE_KEY, rpc_url="http://rpc.invalid")
+    )
+
+    assert recorder.is_enabled
+    assert recorder.contract_address == Web3.to_checksum_address(
+        action_recorder.DEFAULT_ACTION_REPO_ADDRESS
+    )
+    assert recorder.account_address is not None
+
+
+def test_recorder_disabled_without_private_key(offline_web3):
+    """A missing key skips initialisation instead of raising."""
+    recorder = ActionRecorder(
+        RecorderConfig(private_key="", rpc_url="http://rpc.invalid")
+    )
+
+    assert not recorder.is_enabled
@@ -0,0 +1,127 @@
+"""
+Unit tests for StakingCheckpointClient nonce bookkeeping and state persistence.
+The client is built without an RPC endpoint, so no network is needed.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+# Add the olas-sdk-starter directory to the path so we can import the agent package
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "..", "olas-sdk-starter")
+)
+
+from agent import staking_checkpoint
+from agent.staking_checkpoint import CheckpointConfig, StakingCheckpointClient
+
+STAKING_ADDRESS = "0x" + "33" * 20
+
+
+def make_client(state_file, staking_contract_address=STAKING_ADDRESS):
+    """Offline client persisting state to ``state_file``."""
+    return StakingCheckpointClient(
+        CheckpointConfig(
+            private_key="",
+            rpc_url="",
+            staking_contract_address=staking_contract_address,
+            state_file=state_file,
+        )
+    )
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Offline client persisting state under a temporary directory."""
+    checkpoint_client = make_client(tmp_path / "checkpoint_state.json")
+    yield checkpoint_client
+    checkpoint_client.close()
+
+
+def test_flush_state_writes_atomically(client):
+    """State lands in the target file with no temp file left behind."""
+    client._record_state(1000, 1200, "0xabc", submission_ts=1100)
+
+    state_file = client._state_file
+    payload = json.loads(state_file.read_text())
+    assert payload["last_checkpoint_ts"] == 1000
+    assert payload["last_submitted_at"] == 1100
+    assert payload["last_tx_hash"] == "0xabc"
+    assert payload["staking_contract_address"] == STAKING_ADDRESS
+    assert list(state_file.parent.iterdir()) == [state_file]
+
+    restored = make_client(state_file)
+    assert restored._last_known_checkpoint_ts == 1000
+    assert restored._last_tx_hash == "0xabc"
+
+
+def test_failed_flush_keeps_previous_state(client, monkeypatch):
+    """A write that fails before the rename leaves the old state readable."""
+    client._record_state(1000, 1200, "0xabc")
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    client._record_state(2000, 2200, "0xdef")
+
+    assert json.loads(client._state_file.read_text())["last_checkpoint_ts"] == 1000
+
+
+def test_flush_state_skips_unchanged_state(client):
+    """Polls within the same minute that change nothing are not rewritten."""
+    client._record_state(1000, 1200, "0xabc", submission_ts=1100)
+    client._state_file.unlink()
+
+    client._record_state(1000, 1210, "0xabc")
+    assert not client._state_file.exists()
+
+    client._record_state(1000, 1260, "0xabc")
+    assert client._state_file.exists()
+
+
+def test_released_nonce_is_reused(client):
+    """A nonce drawn for a transaction that was never sent is handed out again."""
+    client._sync_nonce(7)
+    nonce = next(client._nonce_counter)
+    client._release_nonce(nonce)
+
+    assert next(client._nonce_counter) == 7
+    assert next(client._nonce_counter) == 8
+
+
+def test_rejected_transaction_releases_nonce(client):
+    """Errors other than a taken nonce give the nonce back."""
+    client._sync_nonce(3)
+    nonce = next(client._nonce_counter)
+
+    assert not client._handle_value_error(ValueError("insufficient funds"), nonce)
+    assert next(client._nonce_counter) == 3
+
+
+def test_taken_nonce_resyncs_after_repeated_strikes(client, monkeypatch):
+    """A taken nonce moves on locally until the strike limit forces a resync."""
+    monkeypatch.setattr(staking_checkpoint, "NONCE_RESYNC_INTERVAL_SECONDS", 3600.0)
+    client._sync_nonce(5)
+
+    for strike in range(1, staking_checkpoint.NONCE_RESYNC_STRIKES):
+        nonce = next(client._nonce_counter)
+        assert client._handle_value_error(ValueError("nonce too low"), nonce)
+        assert client._nonce_counter is not None, strike
+
+    nonce = next(client._nonce_counter)
+    assert client._handle_value_error(ValueError("nonce too low"), nonce)
+    assert client._nonce_counter is None
+
+
+def test_liveness_period_restored_for_same_contract(client):
+    """The on-chain livenessPeriod survives a restart for the same contract only."""
+    client._cached_liveness_period = 500
+    client._record_state(1000, 1200, None)
+
+    state_file = client._state_file
+    assert make_client(state_file)._cached_liveness_period == 500
+    other = make_client(state_file, staking_contract_address="0x" + "44" * 20)
+    assert other._cached_liveness_period is None
@@ -0,0 +1,222 @@
+"""
+Unit tests for PettWebSocketClient request/response correlation.
+A fake socket records outgoing frames so no server is needed.
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+import websockets
+
+# Add the olas-sdk-starter directory to the path so we can import the agent package
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "..", "olas-sdk-starter")
+)
+
+from agent.pett_websocket_client import PettWebSocketClient
+
+
+class FakeWebSocket:
+    """Records frames passed to send()."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, payload, text=False):
+        self.sent.append(payload)
+
+    async def close(self):
+        pass
+
+    def last_message(self):
+        return json.loads(self.sent[-1])
+
+
+@pytest.fixture
+def client():
+    """Client wired to a fake, already authenticated socket."""
+    ws_client = PettWebSocketClient()
+    ws_client.websocket = FakeWebSocket()
+    ws_client.connection_established = True
+    ws_client.authenticated = True
+    return ws_client
+
+
+@pytest.mark.asyncio
+async def test_sender_writes_frames_in_order(client):
+    """Frames queued through the outbox go out in submission order."""
+    client._start_sender()
+    try:
+        await asyncio.gather(*(client._write_frame(b"%d" % i) for i in range(5)))
+    finally:
+        await client._stop_sender()
+
+    assert client.websocket.sent == [b"0", b"1", b"2", b"3", b"4"]
+
+
+@pytest.mark.asyncio
+async def test_sender_fails_pending_frames_without_socket(client):
+    """A frame queued after the socket is gone fails instead of hanging."""
+    client._start_sender()
+    client.websocket = None
+    try:
+        with pytest.raises(websockets.exceptions.InvalidState):
+            await asyncio.wait_for(client._write_frame(b"lost"), timeout=1)
+    finally:
+        await client._stop_sender()
+
+
+async def wait_for_frames(fake, count):
+    """Yield to the loop until ``count`` frames were sent."""
+    for _ in range(100):
+        if len(fake.sent) >= count:
+            return
+        await asyncio.sleep(0)
+    raise AssertionError(f"expected {count} frames, got {len(fake.sent)}")
+
+
+@pytest.mark.asyncio
+async def test_send_and_wait_resolves_by_nonce(client):
+    """The response carrying the request nonce resolves the waiting caller."""
+    task = asyncio.create_task(client._send_and_wait("PET_RUB", timeout=1))
+    await wait_for_frames(client.websocket, 1)
+    nonce = client.websocket.last_message()["nonce"]
+
+    # A frame for another request must not resolve this one
+    await client._handle_message({"type": "ok", "nonce": str(int(nonce) + 1)})
+    assert not task.done()
+
+    response = {"type": "ok", "nonce": nonce}
+    await client._handle_message(response)
+
+    assert await task == (True, response)
+    assert client._pop_pending(nonce) is None
+
+
+@pytest.mark.asyncio
+async def test_send_and_wait_reports_error_response(client):
+    """An error frame for the nonce marks the request as failed."""
+    task = asyncio.create_task(client._send_and_wait("PET_RUB", timeout=1))
+    await wait_for_frames(client.websocket, 1)
+    nonce = client.websocket.last_message()["nonce"]
+
+    await client._handle_message({"type": "error", "nonce": nonce, "error": "nope"})
+
+    success, _ = await task
+    assert not success
+    assert client._last_action_error == "nope"
+
+
+@pytest.mark.asyncio
+async def test_stale_nonce_does_not_resolve_reused_slot(client):
+    """A late reply for an evicted nonce leaves the slot's new owner pending."""
+    old_nonce = "7"
+    new_nonce = str(7 + len(client._pending_ring))
+    client._register_pending(old_nonce)
+    newer = client._register_pending(new_nonce)
+
+    client._resolve_pending(old_nonce, {"type": "ok"})
+
+    assert not newer.done()
+    assert client._pop_pending(new_nonce) is newer
+
+
+def test_frame_has_consumer(client):
+    """Only frames with a nonce or a handled type are parsed."""
+    assert client._frame_has_consumer(b'{"type":"unhandled_kind","nonce":"4"}')
+    assert client._frame_has_consumer(b'{"type":"data","data":{}}')
+    assert client._frame_has_consumer(b'{"data":{"type":"data"},"type":"x"}')
+    assert not client._frame_has_consumer(b'{"type":"unhandled_kind"}')
+
+    async def handler(message):
+        pass
+
+    client.register_message_handler("unhandled_kind", handler)
+    assert client._frame_has_consumer(b'{"type":"unhandled_kind"}')
+
+
+@pytest.mark.asyncio
+async def test_data_frame_resolves_inflight_request(client):
+    """A data frame with a request nonce resolves only that request."""
+    kitchen = asyncio.create_task(
+        client._request_and_await_future(
+            "KITCHEN_GET", timeout=1, label="kitchen request"
+        )
+    )
+    mall = asyncio.create_task(
+        client._request_and_await_future("MALL_GET", timeout=1, label="mall request")
+    )
+    await wait_for_frames(client.websocket, 2)
+    kitchen_nonce, mall_nonce = (
+        json.loads(frame)["nonce"] for frame in client.websocket.sent
+    )
+
+    await client._handle_message(
+        {"type": "data", "nonce": mall_nonce, "data": {"items": ["hat"]}}
+    )
+    assert json.loads(await mall) == {"items": ["hat"]}
+    assert not kitchen.done()
+
+    await client._handle_message(
+        {"type": "data", "nonce": kitchen_nonce, "data": {"food": 1}}
+    )
+    assert json.loads(await kitchen) == {"food": 1}
+    assert client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_send_and_wait_frees_slot_on_timeout(client):
+    """A request nobody answers releases its pending slot."""
+    success, response = await client._send_and_wait("PET_RUB", timeout=0.01)
+    nonce = client.websocket.last_message()["nonce"]
+
+    assert (success, response) == (True, None)
+    assert client._pop_pending(nonce) is None
+
+
+@pytest.mark.asyncio
+async def test_send_and_wait_frees_slot_on_cancellation(client):
+    """A cancelled caller does not leave its future in the ring."""
+    task = asyncio.create_task(client._send_and_wait("PET_RUB", timeout=1))
+    await wait_for_frames(client.websocket, 1)
+    nonce = client.websocket.last_message()["nonce"]
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert client._pop_pending(nonce) is None
+
+
+@pytest.mark.asyncio
+async def test_claim_inflight_without_nonce_takes_oldest_matching(client):
+    """Frames without a nonce go to the oldest request of the matching kind."""
+    loop = asyncio.get_running_loop()
+    closet, search, kitchen = (loop.create_future() for _ in range(3))
+    client._inflight.update(
+        {
+            "1": ("CLOSET_GET", closet),
+            "2": ("AI_SEARCH", search),
+            "3": ("KITCHEN_GET", kitchen),
+        }
+    )
+
+    assert client._claim_inflight(None, True) == ("AI_SEARCH", search)
+    assert client._claim_inflight(None, False) == ("CLOSET_GET", closet)
+    assert list(client._inflight) == ["3"]
+
+
+@pytest.mark.asyncio
+async def test_uncorrelated_data_frame_resolves_one_request(client):
+    """One data frame without a nonce never resolves several requests."""
+    loop = asyncio.get_running_loop()
+    kitchen, mall = loop.create_future(), loop.create_future()
+    client._inflight.update({"1": ("KITCHEN_GET", kitchen), "2": ("MALL_GET", mall)})
+
+    await client._handle_message({"type": "data", "data": {"food": 1}})
+
+    assert json.loads(kitchen.result()) == {"food": 1}
+    assert not mall.done()